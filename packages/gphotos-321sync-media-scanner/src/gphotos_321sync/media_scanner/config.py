@@ -3,6 +3,7 @@
 import os
 from pydantic import BaseModel, Field, ConfigDict
 from gphotos_321sync.common import LoggingConfig
+from gphotos_321sync.media_scanner.parallel.queue_manager import default_queue_maxsize
 
 
 class ScannerConfig(BaseModel):
@@ -31,8 +32,8 @@ class ScannerConfig(BaseModel):
         description="Number of records to batch for database writes"
     )
     queue_maxsize: int = Field(
-        default=1000,
-        description="Maximum size of work and results queues"
+        default_factory=default_queue_maxsize,
+        description="Maximum size of work and results queues (default: 128 × CPU cores, minimum 1000)"
     )
     use_ffprobe: bool = Field(
         default=False,
@@ -6,17 +6,23 @@ Handles Google Takeout directory structure and various edge cases.
 
 import json
 import logging
+import os
 import re
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator, Optional, List, Dict
+from typing import AbstractSet, Iterator, Optional, List, Dict
 
 from .path_utils import should_scan_file
 
 logger = logging.getLogger(__name__)
 
+# Directory listing is I/O wait, so threads well beyond the core count pay off
+_WALK_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 # Known media file extensions supported by Google Photos
 # Full extensions that can be used in matching
 # NOTE: Only unambiguous shortened prefixes are allowed
@@ -108,10 +114,13 @@ def _extensions_match(media_ext: str, sidecar_ext: str) -> bool:
     return False
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Information about a discovered media file.
     
+    Uses __slots__: one instance exists per media file, so dropping the
+    per-instance __dict__ keeps large Takeouts compact.
+    
     Attributes:
         file_path: Absolute path to the media file
         relative_path: Path relative to scan root
@@ -130,12 +139,12 @@ class FileInfo:
 class BatchMatchingResult:
     """Result of batch matching operation with phase-by-phase tracking."""
     matches: Dict[Path, Optional[Path]]  # media_file -> sidecar_path
-    matched_phase1: set[Path]  # Media files matched in Phase 1
-    matched_phase2: set[Path]  # Media files matched in Phase 2
-    matched_phase3: set[Path]  # Media files matched in Phase 3
-    matched_phase4: set[Path]  # Media files matched in Phase 4
-    unmatched_media: set[Path]  # Media files that couldn't be matched
-    unmatched_sidecars: set[Path]  # Sidecars that couldn't be matched
+    matched_phase1: AbstractSet[Path]  # Media files matched in Phase 1
+    matched_phase2: AbstractSet[Path]  # Media files matched in Phase 2
+    matched_phase3: AbstractSet[Path]  # Media files matched in Phase 3
+    matched_phase4: AbstractSet[Path]  # Media files matched in Phase 4
+    unmatched_media: AbstractSet[Path]  # Media files that couldn't be matched
+    unmatched_sidecars: AbstractSet[Path]  # Sidecars that couldn't be matched
 
 
 @dataclass
@@ -159,9 +168,8 @@ class DiscoveryResult:
         all_sidecars: Set of all discovered sidecar paths (for orphan detection)
         
         # Phase-by-phase matching results
-        matched_phase1: Set of media files matched in Phase 1 (happy path)
-        matched_phase2: Set of media files matched in Phase 2 (numbered files)
-        matched_phase3: Set of media files matched in Phase 3 (edited files)
+        matched_by_phase: Mapping of each matched media file to its matching phase (1-4);
+            matched_phase1..matched_phase4 are derived views over it
         unmatched_media: Set of media files that couldn't be matched
         unmatched_sidecars: Set of sidecars that couldn't be matched
         
@@ -173,22 +181,108 @@ class DiscoveryResult:
     """
     files: List[FileInfo]
     json_sidecar_count: int
-    paired_sidecars: set[Path]
-    all_sidecars: set[Path]
+    paired_sidecars: AbstractSet[Path]
+    all_sidecars: AbstractSet[Path]
 
     # Phase-by-phase matching results
-    matched_phase1: set[Path]  # Happy path matches (exact filename, no numeric suffix)
-    matched_phase2: set[Path] # Numbered files matches (extract numeric suffix)
-    matched_phase3: set[Path] # Edited files matches (strip "-edited")
-    matched_phase4: set[Path] # Prefix-based matches (different filename lengths)
-    unmatched_media: set[Path]
-    unmatched_sidecars: set[Path]
+    matched_by_phase: Dict[Path, int]  # media_file -> phase it matched in (1-4)
+    unmatched_media: AbstractSet[Path]
+    unmatched_sidecars: AbstractSet[Path]
     
     # File type discovery
-    discovered_media: set[Path]
-    discovered_sidecars: set[Path]
-    discovered_metadata: set[Path]
-    discovered_other: set[Path]
+    discovered_media: AbstractSet[Path]
+    discovered_sidecars: AbstractSet[Path]
+    discovered_metadata: AbstractSet[Path]
+    discovered_other: AbstractSet[Path]
+
+    def _matched_in_phase(self, phase: int) -> set[Path]:
+        return {path for path, matched in self.matched_by_phase.items() if matched == phase}
+
+    @property
+    def matched_phase1(self) -> set[Path]:
+        """Happy path matches (exact filename, no numeric suffix)."""
+        return self._matched_in_phase(1)
+
+    @property
+    def matched_phase2(self) -> set[Path]:
+        """Numbered files matches (extract numeric suffix)."""
+        return self._matched_in_phase(2)
+
+    @property
+    def matched_phase3(self) -> set[Path]:
+        """Edited files matches (strip "-edited")."""
+        return self._matched_in_phase(3)
+
+    @property
+    def matched_phase4(self) -> set[Path]:
+        """Prefix-based matches (different filename lengths)."""
+        return self._matched_in_phase(4)
+
+    def phase_counts(self) -> Counter:
+        """Count matched media files per phase in a single pass."""
+        return Counter(self.matched_by_phase.values())
+
+
+def _scandir(directory: Path, subdirs: List[Path]) -> List[tuple[Path, os.DirEntry]]:
+    """List one directory, appending its subdirectories to subdirs.
+    
+    DirEntry.is_dir()/is_file() are answered from the directory listing itself,
+    so no per-entry stat is issued. Symlinked directories are not descended into
+    (same as Path.rglob).
+    
+    Args:
+        directory: Directory to list
+        subdirs: List that receives the subdirectories found
+        
+    Returns:
+        List of (directory, DirEntry) tuples for the files in directory
+    """
+    files = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(Path(entry.path))
+                elif entry.is_file():
+                    files.append((directory, entry))
+    except OSError as e:
+        logger.warning(f"Cannot read directory: {{'path': {str(directory)!r}, 'error': {str(e)!r}}}")
+    return files
+
+
+def _walk_tree(top: Path) -> List[tuple[Path, os.DirEntry]]:
+    """Serially list every file under top using a stack of pending directories."""
+    files = []
+    stack = [top]
+    while stack:
+        files.extend(_scandir(stack.pop(), stack))
+    return files
+
+
+def _walk_files(scan_root: Path) -> Iterator[tuple[Path, os.DirEntry]]:
+    """Yield (parent_dir, entry) for every file under scan_root.
+    
+    The subdirectories of scan_root (albums in a Takeout) are walked concurrently,
+    so directory listing latency overlaps across albums instead of adding up.
+    
+    Args:
+        scan_root: Root directory to walk
+        
+    Yields:
+        Tuples of (directory containing the file, DirEntry for the file)
+    """
+    album_dirs: List[Path] = []
+    yield from _scandir(scan_root, album_dirs)
+    
+    if len(album_dirs) <= 1:
+        for album_dir in album_dirs:
+            yield from _walk_tree(album_dir)
+        return
+    
+    workers = min(_WALK_MAX_WORKERS, len(album_dirs))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="discovery-walk") as executor:
+        for album_files in executor.map(_walk_tree, album_dirs):
+            yield from album_files
 
 
 def discover_files(target_media_path: Path) -> DiscoveryResult:
@@ -211,38 +305,32 @@ def discover_files(target_media_path: Path) -> DiscoveryResult:
     discovered_sidecars = set()
     discovered_metadata = set()
     discovered_other = set()
+    media_sizes: Dict[Path, int] = {}  # Sizes from the cached DirEntry stat
     
-    # Step 1: Identify files outside album directories (top-level files)
-    for file_path in scan_root.rglob("*"):
-        if file_path.is_file() and file_path.parent == scan_root:
-            # Files at the top level of Google Photos directory
+    # Single pass over the tree: categorize every file as media/sidecar/metadata/other
+    for parent_dir, entry in _walk_files(scan_root):
+        file_path = Path(entry.path)
+        if parent_dir == scan_root:
+            # Files at the top level of Google Photos directory are outside albums
             discovered_other.add(file_path)
-    
-    # Step 2: Process all files as potential media/sidecars/metadata
-    for file_path in scan_root.rglob("*"):
-        if file_path.is_file():
-            if file_path.suffix.lower() == '.json':
-                if file_path.name == "metadata.json":
-                    discovered_metadata.add(file_path)
-                else:
-                    discovered_sidecars.add(file_path)
-            elif should_scan_file(file_path):
-                discovered_media.add(file_path)
+        elif file_path.suffix.lower() == '.json':
+            if file_path.name == "metadata.json":
+                discovered_metadata.add(file_path)
             else:
-                discovered_other.add(file_path)
-    
-    # Step 3: Remove any intersections (files that were already categorized as "other")
-    discovered_media -= discovered_other
-    discovered_sidecars -= discovered_other
-    discovered_metadata -= discovered_other
+                discovered_sidecars.add(file_path)
+        elif should_scan_file(file_path):
+            discovered_media.add(file_path)
+            try:
+                media_sizes[file_path] = entry.stat().st_size
+            except OSError:
+                pass  # Fall back to stat when building FileInfo
+        else:
+            discovered_other.add(file_path)
     
     # Process files and collect phase-by-phase results
     files = []
     paired_sidecars = set()
-    matched_phase1 = set()
-    matched_phase2 = set()
-    matched_phase3 = set()
-    matched_phase4 = set()
+    matched_by_phase = {}
     unmatched_media = set()
     unmatched_sidecars = set()
     
@@ -254,17 +342,16 @@ def discover_files(target_media_path: Path) -> DiscoveryResult:
             media_by_album[album_path] = []
         media_by_album[album_path].append(media_file)
     
-    # Build sidecar index once for ALL sidecars
-    full_sidecar_index = {}
+    # Build sidecar index once for ALL sidecars, grouped by album directory
+    # so each album picks up its own index with a single lookup
+    sidecar_index_by_album: Dict[Path, Dict[str, List[ParsedSidecar]]] = {}
     for sidecar_path in discovered_sidecars:
         parsed = _parse_sidecar_filename(sidecar_path)
-        # Use full path as key to include album info
+        # Simple key format (filename.extension) used by the batch matcher
         # Extension is already normalized to lowercase in ParsedSidecar
         ext = parsed.extension if parsed.extension else ""
-        key = f"{sidecar_path.parent}/{parsed.filename}.{ext}"
-        if key not in full_sidecar_index:
-            full_sidecar_index[key] = []
-        full_sidecar_index[key].append(parsed)
+        album_index = sidecar_index_by_album.setdefault(sidecar_path.parent, {})
+        album_index.setdefault(f"{parsed.filename}.{ext}", []).append(parsed)
     
     # Process each album with batch matching
     for album_path, album_media_files in media_by_album.items():
@@ -273,32 +360,24 @@ def discover_files(target_media_path: Path) -> DiscoveryResult:
             logger.debug(f"Skipping album {album_path}: no media files")
             continue
         
-        # Filter sidecar index for this album from the full index
-        album_sidecar_index = {}
-        for key, sidecar_list in full_sidecar_index.items():
-            # Extract album path from the full key
-            for sidecar in sidecar_list:
-                if sidecar.full_sidecar_path.parent == album_path:
-                    # Use simple key format (filename.extension) for album-specific index
-                    simple_key = key.split('/')[-1] if '/' in key else key
-                    if simple_key not in album_sidecar_index:
-                        album_sidecar_index[simple_key] = []
-                    album_sidecar_index[simple_key].append(sidecar)
+        album_sidecar_index = sidecar_index_by_album.get(album_path, {})
         
         # Process album with batch algorithm
         batch_result = _match_media_to_sidecar_batch(album_media_files, album_sidecar_index)
         
         # Collect phase-by-phase results
-        matched_phase1.update(batch_result.matched_phase1)
-        matched_phase2.update(batch_result.matched_phase2)
-        matched_phase3.update(batch_result.matched_phase3)
-        matched_phase4.update(batch_result.matched_phase4)
+        phase_sets = (batch_result.matched_phase1, batch_result.matched_phase2,
+                      batch_result.matched_phase3, batch_result.matched_phase4)
+        for phase, phase_matches in enumerate(phase_sets, start=1):
+            matched_by_phase.update(dict.fromkeys(phase_matches, phase))
         unmatched_media.update(batch_result.unmatched_media)
         unmatched_sidecars.update(batch_result.unmatched_sidecars)
         
         # Create FileInfo objects from batch results
         for media_file, sidecar_path in batch_result.matches.items():
-            file_info = _create_file_info_from_batch_result(media_file, scan_root, sidecar_path)
+            file_info = _create_file_info_from_batch_result(
+                media_file, scan_root, sidecar_path, media_sizes.get(media_file)
+            )
             files.append(file_info)
             if sidecar_path:
                 paired_sidecars.add(sidecar_path)
@@ -306,7 +385,9 @@ def discover_files(target_media_path: Path) -> DiscoveryResult:
         # CRITICAL FIX: Also create FileInfo objects for unmatched media files
         # These need to be processed even without sidecars for metadata extraction
         for unmatched_media_file in batch_result.unmatched_media:
-            file_info = _create_file_info_from_batch_result(unmatched_media_file, scan_root, None)
+            file_info = _create_file_info_from_batch_result(
+                unmatched_media_file, scan_root, None, media_sizes.get(unmatched_media_file)
+            )
             files.append(file_info)
     
     return DiscoveryResult(
@@ -316,10 +397,7 @@ def discover_files(target_media_path: Path) -> DiscoveryResult:
         all_sidecars=discovered_sidecars,
         
         # Phase-by-phase matching results
-        matched_phase1=matched_phase1,
-        matched_phase2=matched_phase2,
-        matched_phase3=matched_phase3,
-        matched_phase4=matched_phase4,
+        matched_by_phase=matched_by_phase,
         unmatched_media=unmatched_media,
         unmatched_sidecars=unmatched_sidecars,
         
@@ -346,25 +424,17 @@ def _collect_files(scan_root: Path) -> tuple[list[Path], list[Path], dict[Path,
     
     logger.info("Collecting all files...")
     
-    # Step 1: Identify top-level files (these are not media/sidecars)
-    top_level_files = set()
-    for file_path in scan_root.rglob("*"):
-        if file_path.is_file() and file_path.parent == scan_root:
-            top_level_files.add(file_path)
-    
-    # Step 2: Process all files as potential media/sidecars
-    for file_path in scan_root.rglob("*"):
-        if file_path.is_dir():
+    # Single pass over the tree: process all files as potential media/sidecars
+    for parent_dir, entry in _walk_files(scan_root):
+        # Skip top-level files (these are not media/sidecars)
+        if parent_dir == scan_root:
             continue
         
-        # Skip top-level files (already identified as "other")
-        if file_path in top_level_files:
-            continue
-            
+        file_path = Path(entry.path)
+        
         if not should_scan_file(file_path):
             continue
         
-        parent_dir = file_path.parent
         if parent_dir not in all_files:
             all_files[parent_dir] = set()
         all_files[parent_dir].add(file_path.name)
@@ -379,32 +449,45 @@ def _collect_files(scan_root: Path) -> tuple[list[Path], list[Path], dict[Path,
     return media_files, json_files, all_files
 
 
-def _create_file_info_from_batch_result(media_file: Path, scan_root: Path, sidecar_path: Optional[Path]) -> FileInfo:
+def _create_file_info_from_batch_result(
+    media_file: Path,
+    scan_root: Path,
+    sidecar_path: Optional[Path],
+    file_size: Optional[int] = None,
+) -> FileInfo:
     """Create FileInfo object from batch matching result.
     
     Args:
         media_file: Path to the media file
         scan_root: Root directory for relative path calculation
         sidecar_path: Path to matching sidecar (or None if no match)
+        file_size: Size already known from discovery (stat'ed here if None)
         
     Returns:
         FileInfo object
     """
-    # Calculate relative paths
-    try:
-        relative_path = media_file.relative_to(scan_root)
-    except ValueError:
-        # If media_file is not under scan_root, use the filename
-        relative_path = Path(media_file.name)
+    # Calculate relative paths; slicing the path string skips relative_to's
+    # part-by-part comparison, which matters at one call per media file
+    root_str = str(scan_root)
+    media_str = str(media_file)
+    if media_str.startswith(root_str) and media_str[len(root_str):len(root_str) + 1] == os.sep:
+        relative_path = Path(media_str[len(root_str) + 1:])
+    else:
+        try:
+            relative_path = media_file.relative_to(scan_root)
+        except ValueError:
+            # If media_file is not under scan_root, use the filename
+            relative_path = Path(media_file.name)
     
-    # Calculate album folder path (parent of relative_path)
-    album_folder_path = relative_path.parent if relative_path.parent != Path('.') else Path('.')
+    # Calculate album folder path (parent of relative_path, '.' for top-level files)
+    album_folder_path = relative_path.parent
     
     # Get file size
-    try:
-        file_size = media_file.stat().st_size
-    except OSError:
-        file_size = 0
+    if file_size is None:
+        try:
+            file_size = media_file.stat().st_size
+        except OSError:
+            file_size = 0
     
     return FileInfo(
         file_path=media_file,
@@ -415,6 +498,29 @@ def _create_file_info_from_batch_result(media_file: Path, scan_root: Path, sidec
     )
 
 
+# Known media extensions for sidecar parsing; prefixes count as truncated matches
+_SIDECAR_KNOWN_EXTS = (
+    'jpg', 'jpeg', 'jpe', 'png', 'gif', 'webp', 'heic', 'heif', 'bmp', 'tif', 'tiff', 'svg',
+    'webm', 'mp4', 'mov', 'avi', 'm4v', '3gp', 'jfif', 'dng', 'cr2', 'cr3', 'arw', 'nef', 'raf', 'orf',
+)
+
+# Every extension and every prefix of one, flattened so a token is classified with
+# one set lookup. Single characters are excluded: too ambiguous to be a prefix.
+_SIDECAR_EXT_PREFIXES = frozenset(
+    ext[:i] for ext in _SIDECAR_KNOWN_EXTS for i in range(2, len(ext) + 1)
+)
+
+_JSON_SUFFIX_RE = re.compile(r'\.json\s*$', re.I)
+_PAREN_NUM_RE = re.compile(r'\((\d+)\)\s*$')
+_SUPP_TAIL_RE = re.compile(r'''
+    \.
+    (?:s|supp(?:lemen(?:t(?:al)?)?)?)    # s / supp / supplemen / supplement / supplemental
+    (?:-(?:meta(?:data)?)?)?             # -meta / -metadata (optional)
+    -?                                   # optional lone '-'
+    \s*$                                 # to end
+''', re.I | re.X)
+
+
 def _parse_sidecar_filename(sidecar_path: Path) -> ParsedSidecar:
     """Parse sidecar filename into components.
     
@@ -424,50 +530,24 @@ def _parse_sidecar_filename(sidecar_path: Path) -> ParsedSidecar:
     Returns:
         ParsedSidecar with filename, extension, numeric_suffix components
     """
-    # Known media extensions; prefixes count as truncated matches
-    KNOWN_EXTS = [
-        'jpg','jpeg','jpe','png','gif','webp','heic','heif','bmp','tif','tiff','svg',
-        'webm','mp4','mov','avi','m4v','3gp','jfif','dng','cr2','cr3','arw','nef','raf','orf'
-    ]
-    
-    def is_ext_or_prefix(tok: str) -> bool:
-        t = tok.lower()
-        if not t:
-            return False
-        # Single character cannot be an extension prefix (too ambiguous)
-        if len(t) == 1:
-            return False
-        return any(e.startswith(t) for e in KNOWN_EXTS)
-    
     base = sidecar_path.name
     
     # Require/play nice with trailing .json
-    JSON_RE = re.compile(r'\.json\s*$', re.I)
-    PAREN_NUM_RE = re.compile(r'\((\d+)\)\s*$')
-    
-    if not JSON_RE.search(base):
+    if not _JSON_SUFFIX_RE.search(base):
         core = base
         paren_num = ""
     else:
-        tmp = JSON_RE.sub('', base)          # remove .json
-        m = PAREN_NUM_RE.search(tmp)         # extract "(n)" just before .json
+        tmp = _JSON_SUFFIX_RE.sub('', base)  # remove .json
+        m = _PAREN_NUM_RE.search(tmp)        # extract "(n)" just before .json
         if m:
             paren_num = f"({m.group(1)})"
-            tmp = PAREN_NUM_RE.sub('', tmp)
+            tmp = _PAREN_NUM_RE.sub('', tmp)
         else:
             paren_num = ""
         core = tmp
     
     # Strip supplemental tail if present (between extension and .json)
-    SUPP_TAIL_RE = re.compile(r'''
-        \.
-        (?:s|supp(?:lemen(?:t(?:al)?)?)?)    # s / supp / supplemen / supplement / supplemental
-        (?:-(?:meta(?:data)?)?)?             # -meta / -metadata (optional)
-        -?                                   # optional lone '-'
-        \s*$                                 # to end
-    ''', re.I | re.X)
-    
-    core = SUPP_TAIL_RE.sub('', core)
+    core = _SUPP_TAIL_RE.sub('', core)
     
     # If no dot at all → no extension; filename is the whole core
     if '.' not in core:
@@ -484,7 +564,7 @@ def _parse_sidecar_filename(sidecar_path: Path) -> ParsedSidecar:
     # find rightmost token that is an extension or its prefix
     last_ext_idx = -1
     for i, tok in enumerate(tokens):
-        if is_ext_or_prefix(tok):
+        if tok.lower() in _SIDECAR_EXT_PREFIXES:
             last_ext_idx = i  # keep updating; end with rightmost
     if last_ext_idx == -1:
         # No extension found
@@ -506,7 +586,7 @@ def _parse_sidecar_filename(sidecar_path: Path) -> ParsedSidecar:
     
     # Walk left to include combined extensions (e.g., svg.png, jpg.webp)
     start_ext_idx = last_ext_idx
-    while start_ext_idx - 1 >= 0 and is_ext_or_prefix(tokens[start_ext_idx - 1]):
+    while start_ext_idx - 1 >= 0 and tokens[start_ext_idx - 1].lower() in _SIDECAR_EXT_PREFIXES:
         start_ext_idx -= 1
     
     # Filename is everything BEFORE the extension cluster (allowing dots in filename)
@@ -38,6 +38,22 @@ class ToolNotFoundError(ScannerError):
     pass
 
 
+# Exact exception type -> error category, checked before the isinstance chain
+_ERROR_CATEGORIES = {
+    PermissionDeniedError: 'permission',
+    CorruptedFileError: 'corrupted',
+    IOError: 'io',
+    ParseError: 'parse',
+    UnsupportedFormatError: 'unsupported',
+    ToolNotFoundError: 'tool_missing',
+    PermissionError: 'permission',
+    OSError: 'io',
+    ValueError: 'parse',
+    KeyError: 'parse',
+    AttributeError: 'parse',
+}
+
+
 def classify_error(exception: Exception) -> str:
     """
     Classify an exception into an error category.
@@ -49,6 +65,11 @@ def classify_error(exception: Exception) -> str:
         Error category string: 'permission', 'corrupted', 'io', 'parse', 
         'unsupported', 'tool_missing', or 'unknown'
     """
+    category = _ERROR_CATEGORIES.get(type(exception))
+    if category is not None:
+        return category
+    
+    # Subclasses fall back to the ordered isinstance chain
     if isinstance(exception, PermissionDeniedError):
         return 'permission'
     elif isinstance(exception, CorruptedFileError):
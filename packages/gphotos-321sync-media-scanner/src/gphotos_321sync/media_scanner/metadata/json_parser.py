@@ -8,6 +8,13 @@ from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# orjson parses sidecar bytes several times faster; it is an optional extra.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers see one type.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def parse_json_sidecar(json_path: Path) -> Dict[str, Any]:
     """
@@ -35,8 +42,7 @@ def parse_json_sidecar(json_path: Path) -> Dict[str, Any]:
         raise FileNotFoundError(f"JSON sidecar not found: {json_path}")
     
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _json_loads(json_path.read_bytes())
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON: {{'path': {str(json_path)!r}, 'error': {str(e)!r}}}")
         raise
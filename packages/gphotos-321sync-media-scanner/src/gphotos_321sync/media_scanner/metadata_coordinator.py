@@ -128,7 +128,8 @@ def coordinate_metadata(
     file_info: FileInfo,
     metadata_ext: dict,
     album_id: str,
-    scan_run_id: str
+    scan_run_id: str,
+    sidecar_fingerprint: Optional[str] = None,
 ) -> MediaItemRecord:
     """Coordinate metadata from multiple sources.
     
@@ -143,6 +144,8 @@ def coordinate_metadata(
         metadata_ext: Metadata extraction results (MIME, CRC32, fingerprint, EXIF, video)
         album_id: Album ID for this file
         scan_run_id: Current scan run ID
+        sidecar_fingerprint: SHA-256 of the sidecar if the caller already read it;
+            the sidecar is hashed here when None
         
     Returns:
         MediaItemRecord ready for database insertion
@@ -151,9 +154,8 @@ def coordinate_metadata(
         Exception: Any errors during processing (caller should handle)
     """
     try:
-        # 1. Calculate sidecar fingerprint if present (for change detection)
-        sidecar_fingerprint = None
-        if file_info.json_sidecar_path:
+        # 1. Calculate sidecar fingerprint if present and not already computed by the caller
+        if sidecar_fingerprint is None and file_info.json_sidecar_path:
             try:
                 with open(file_info.json_sidecar_path, 'rb') as f:
                     sidecar_fingerprint = hashlib.sha256(f.read()).hexdigest()
@@ -10,17 +10,42 @@ Use cases:
 - Files with ambiguous naming patterns where filename matching is insufficient
 """
 
+import functools
 import json
 import logging
-from datetime import datetime, timezone
+import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 from gphotos_321sync.media_scanner.metadata.exif_extractor import extract_exif_smart
 from gphotos_321sync.media_scanner.metadata.video_extractor import extract_video_metadata
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+# timestamps_match's default tolerance, built once
+_DEFAULT_TOLERANCE = timedelta(seconds=1)
+
+# orjson parses sidecar bytes several times faster; it is an optional extra
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Takeout writes photoTakenTime.timestamp as the object's first key, so the
+# value can usually be lifted from the raw bytes without a full JSON parse
+_PHOTO_TAKEN_TIMESTAMP_RE = re.compile(rb'"photoTakenTime"\s*:\s*\{\s*"timestamp"\s*:\s*"(\d+)"')
+
+# Candidate lists longer than this read media timestamps concurrently
+_PARALLEL_THRESHOLD = 4
+
+# Reads in flight at once; a match stops later windows from being submitted
+_READ_WINDOW = 8
+
 
 def parse_sidecar_timestamp(sidecar_path: Path) -> Optional[datetime]:
     """Extract photoTakenTime timestamp from Google Takeout JSON sidecar.
@@ -31,9 +56,55 @@ def parse_sidecar_timestamp(sidecar_path: Path) -> Optional[datetime]:
     Returns:
         Timezone-aware datetime object, or None if parsing fails
     """
+    timestamp = parse_sidecar_timestamp_epoch(sidecar_path)
+    if timestamp is None:
+        return None
+    
     try:
-        with open(sidecar_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        return datetime.fromtimestamp(timestamp, _UTC)
+    except (ValueError, OverflowError, OSError) as e:
+        logger.warning(f"Failed to parse sidecar timestamp: {{'path': {str(sidecar_path)!r}, 'error': {str(e)!r}}}")
+        return None
+
+
+def parse_sidecar_timestamp_epoch(sidecar_path: Path) -> Optional[int]:
+    """Extract photoTakenTime from a sidecar as Unix seconds, without building a datetime.
+    
+    Results are cached per (path, mtime, size), so repeated lookups of an
+    unchanged sidecar during a scan do not re-read or re-parse it.
+    
+    Args:
+        sidecar_path: Path to .supplemental-metadata.json file
+        
+    Returns:
+        Seconds since the Unix epoch, or None if parsing fails
+    """
+    # Read errors propagate out of the cached parse (lru_cache does not store
+    # exceptions), so a file that becomes readable later is retried
+    try:
+        stat = sidecar_path.stat()
+        return _parse_sidecar_epoch_cached(sidecar_path, stat.st_mtime_ns, stat.st_size)
+    except OSError as e:
+        logger.warning(f"Failed to parse sidecar timestamp: {{'path': {str(sidecar_path)!r}, 'error': {str(e)!r}}}")
+        return None
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_sidecar_epoch_cached(sidecar_path: Path, mtime_ns: int, size: int) -> Optional[int]:
+    """Read and parse a sidecar; mtime_ns and size only key the cache.
+    
+    Raises:
+        OSError: If the sidecar cannot be read
+    """
+    raw = sidecar_path.read_bytes()
+    
+    try:
+        match = _PHOTO_TAKEN_TIMESTAMP_RE.search(raw)
+        if match:
+            return int(match.group(1))
+        
+        # Fall back to a full parse (e.g. reordered keys or missing field)
+        data = _json_loads(raw)
         
         # Google Takeout format: {"photoTakenTime": {"timestamp": "1234567890"}}
         photo_taken = data.get('photoTakenTime', {})
@@ -43,17 +114,37 @@ def parse_sidecar_timestamp(sidecar_path: Path) -> Optional[datetime]:
             logger.debug(f"No photoTakenTime.timestamp in sidecar: {{'path': {str(sidecar_path)!r}}}")
             return None
         
-        # Parse Unix timestamp (seconds since epoch)
-        timestamp = int(timestamp_str)
-        dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        # Unix timestamp (seconds since epoch)
+        return int(timestamp_str)
         
-        return dt
-        
-    except (json.JSONDecodeError, ValueError, OSError) as e:
+    except (json.JSONDecodeError, ValueError) as e:
         logger.warning(f"Failed to parse sidecar timestamp: {{'path': {str(sidecar_path)!r}, 'error': {str(e)!r}}}")
         return None
 
 
+def parse_sidecar_timestamps_batch(
+    sidecar_paths: list[Path],
+    max_workers: int = 8
+) -> dict[Path, Optional[datetime]]:
+    """Extract photoTakenTime timestamps from many sidecars at once.
+    
+    Reads are issued from a thread pool so file I/O overlaps; the GIL is
+    released while each thread waits on the read.
+    
+    Args:
+        sidecar_paths: Paths to .supplemental-metadata.json files
+        max_workers: Maximum number of concurrent reader threads
+        
+    Returns:
+        Mapping of each sidecar path to its timestamp (None if parsing fails)
+    """
+    if not sidecar_paths:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sidecar_paths))) as executor:
+        return dict(zip(sidecar_paths, executor.map(parse_sidecar_timestamp, sidecar_paths)))
+
+
 def parse_media_timestamp(media_path: Path, use_exiftool: bool = False, use_ffprobe: bool = False) -> Optional[datetime]:
     """Extract timestamp from media file EXIF/metadata.
     
@@ -112,8 +203,54 @@ def timestamps_match(ts1: Optional[datetime], ts2: Optional[datetime], tolerance
     if ts1 is None or ts2 is None:
         return False
     
-    diff = abs((ts1 - ts2).total_seconds())
-    return diff <= tolerance_seconds
+    tolerance = _DEFAULT_TOLERANCE if tolerance_seconds == 1 else timedelta(seconds=tolerance_seconds)
+    return abs(ts1 - ts2) <= tolerance
+
+
+def timestamps_match_epoch(ts1: Optional[int], ts2: Optional[int], tolerance_seconds: int = 1) -> bool:
+    """Check if two Unix-second timestamps match within tolerance.
+    
+    Integer counterpart of timestamps_match for callers that already hold
+    epoch seconds (e.g. from parse_sidecar_timestamp_epoch).
+    
+    Args:
+        ts1: First timestamp in seconds since the epoch
+        ts2: Second timestamp in seconds since the epoch
+        tolerance_seconds: Maximum difference in seconds to consider a match
+        
+    Returns:
+        True if timestamps match within tolerance, False otherwise
+    """
+    if ts1 is None or ts2 is None:
+        return False
+    
+    return abs(ts1 - ts2) <= tolerance_seconds
+
+
+def _match_epoch(sidecar_epoch: int, media_ts: Optional[datetime], tolerance_seconds: int) -> bool:
+    """timestamps_match for a sidecar timestamp already converted to epoch seconds.
+    
+    A naive media timestamp is taken as UTC, the same convention the EXIF
+    extractor uses, rather than as the host's local time.
+    """
+    if media_ts is None:
+        return False
+    
+    if media_ts.tzinfo is None:
+        media_ts = media_ts.replace(tzinfo=_UTC)
+    
+    return abs(media_ts.timestamp() - sidecar_epoch) <= tolerance_seconds
+
+
+def _read_in_windows(read: Callable[[Path], Optional[datetime]], paths: list[Path]) -> Iterator[Optional[datetime]]:
+    """Yield read(path) for each path in order, running up to _READ_WINDOW reads at once.
+    
+    The pool lives only for the call. Closing the generator early cancels the
+    current window's reads that have not started and never submits later ones.
+    """
+    with ThreadPoolExecutor(max_workers=_READ_WINDOW, thread_name_prefix="metadata-match") as executor:
+        for start in range(0, len(paths), _READ_WINDOW):
+            yield from executor.map(read, paths[start:start + _READ_WINDOW])
 
 
 def match_sidecar_by_metadata(
@@ -146,23 +283,33 @@ def match_sidecar_by_metadata(
         >>> match = match_sidecar_by_metadata(sidecar, candidates)
         >>> # Returns Path("Лис/DSC_3767.JPG") if timestamps match
     """
-    # Parse sidecar timestamp
-    sidecar_ts = parse_sidecar_timestamp(sidecar_path)
-    if sidecar_ts is None:
+    # Compare as plain numbers rather than subtracting datetimes per candidate
+    sidecar_epoch = parse_sidecar_timestamp_epoch(sidecar_path)
+    if sidecar_epoch is None:
         logger.debug(f"Cannot match by metadata - no timestamp in sidecar: {{'path': {str(sidecar_path)!r}}}")
         return None
     
-    # Try to match against each candidate
-    for media_path in candidate_media_paths:
-        media_ts = parse_media_timestamp(media_path, use_exiftool=use_exiftool, use_ffprobe=use_ffprobe)
-        
-        if timestamps_match(sidecar_ts, media_ts, tolerance_seconds):
-            logger.info(
-                f"Metadata-based match found: {{'sidecar': {str(sidecar_path)!r}, 'media': {str(media_path)!r}, 'timestamp': {sidecar_ts.isoformat()}}}"
-            )
-            return media_path
+    def read_media_timestamp(media_path: Path) -> Optional[datetime]:
+        return parse_media_timestamp(media_path, use_exiftool=use_exiftool, use_ffprobe=use_ffprobe)
+    
+    # Long candidate lists overlap their (I/O-bound) timestamp reads; results
+    # are still checked in candidate order, so the first match wins either way
+    if len(candidate_media_paths) > _PARALLEL_THRESHOLD:
+        media_timestamps = _read_in_windows(read_media_timestamp, candidate_media_paths)
+    else:
+        media_timestamps = (read_media_timestamp(p) for p in candidate_media_paths)
+    
+    # Try to match against each candidate; closing on exit drops the window's
+    # unstarted reads and waits for the pool before returning
+    with closing(media_timestamps):
+        for media_path, media_ts in zip(candidate_media_paths, media_timestamps):
+            if _match_epoch(sidecar_epoch, media_ts, tolerance_seconds):
+                logger.info(
+                    f"Metadata-based match found: {{'sidecar': {str(sidecar_path)!r}, 'media': {str(media_path)!r}, 'timestamp': {sidecar_epoch}}}"
+                )
+                return media_path
     
     logger.debug(
-        f"No metadata match found: {{'sidecar': {str(sidecar_path)!r}, 'candidates': {len(candidate_media_paths)}, 'timestamp': {sidecar_ts.isoformat()}}}"
+        f"No metadata match found: {{'sidecar': {str(sidecar_path)!r}, 'candidates': {len(candidate_media_paths)}, 'timestamp': {sidecar_epoch}}}"
     )
     return None
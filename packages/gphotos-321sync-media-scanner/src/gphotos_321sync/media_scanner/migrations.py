@@ -1,5 +1,6 @@
 """Database migration system for schema versioning."""
 
+import functools
 import logging
 from pathlib import Path
 from typing import Optional, List
@@ -10,6 +11,63 @@ from .database import DatabaseConnection
 logger = logging.getLogger(__name__)
 
 
+def _discover_migrations(schema_dir: Path) -> tuple[tuple[int, Path], ...]:
+    """
+    Find migration files in a schema directory.
+    
+    Listings are cached per (directory, mtime), so adding, removing or
+    renaming a migration is picked up; a missing directory is never cached.
+    
+    Args:
+        schema_dir: Directory containing migration SQL files
+        
+    Returns:
+        Tuple of (version, path) pairs sorted by version
+    """
+    try:
+        mtime_ns = schema_dir.stat().st_mtime_ns
+    except OSError:
+        logger.warning(f"Schema directory not found: {{'path': {str(schema_dir)!r}}}")
+        return ()
+    
+    return _discover_migrations_cached(schema_dir, mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _discover_migrations_cached(schema_dir: Path, mtime_ns: int) -> tuple[tuple[int, Path], ...]:
+    """List a schema directory's migrations; mtime_ns only keys the cache."""
+    migrations = []
+    
+    # Find all SQL files matching pattern: NNN_*.sql
+    for sql_file in schema_dir.glob("*.sql"):
+        try:
+            # Extract version number from filename (e.g., "001_initial_schema.sql" -> 1)
+            version_str = sql_file.stem.split('_')[0]
+            version = int(version_str)
+            migrations.append((version, sql_file))
+        except (ValueError, IndexError):
+            logger.warning(f"Skipping invalid migration file: {{'name': {sql_file.name!r}}}")
+            continue
+    
+    # Sort by version number
+    migrations.sort(key=lambda x: x[0])
+    
+    logger.debug(f"Found migration files: {{'count': {len(migrations)}}}")
+    return tuple(migrations)
+
+
+def _read_migration_sql(migration_path: Path) -> str:
+    """Read a migration file's SQL, cached per (path, mtime, size) so edits are picked up."""
+    stat = migration_path.stat()
+    return _read_migration_sql_cached(migration_path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_migration_sql_cached(migration_path: Path, mtime_ns: int, size: int) -> str:
+    """Read a migration file; mtime_ns and size only key the cache."""
+    return migration_path.read_text(encoding='utf-8')
+
+
 class MigrationRunner:
     """
     Manages database schema migrations.
@@ -63,28 +121,7 @@ class MigrationRunner:
         Returns:
             List of (version, path) tuples sorted by version
         """
-        migrations = []
-        
-        if not self.schema_dir.exists():
-            logger.warning(f"Schema directory not found: {{'path': {str(self.schema_dir)!r}}}")
-            return migrations
-        
-        # Find all SQL files matching pattern: NNN_*.sql
-        for sql_file in self.schema_dir.glob("*.sql"):
-            try:
-                # Extract version number from filename (e.g., "001_initial_schema.sql" -> 1)
-                version_str = sql_file.stem.split('_')[0]
-                version = int(version_str)
-                migrations.append((version, sql_file))
-            except (ValueError, IndexError):
-                logger.warning(f"Skipping invalid migration file: {{'name': {sql_file.name!r}}}")
-                continue
-        
-        # Sort by version number
-        migrations.sort(key=lambda x: x[0])
-        
-        logger.debug(f"Found migration files: {{'count': {len(migrations)}}}")
-        return migrations
+        return list(_discover_migrations(self.schema_dir))
     
     def apply_migrations(self, target_version: Optional[int] = None) -> None:
         """
@@ -142,7 +179,7 @@ class MigrationRunner:
         
         # Read migration SQL
         try:
-            sql = migration_path.read_text(encoding='utf-8')
+            sql = _read_migration_sql(migration_path)
         except IOError as e:
             logger.error(f"Failed to read migration file: {{'error': {str(e)!r}}}")
             raise
@@ -4,12 +4,22 @@ Manages work and results queues with backpressure control.
 """
 
 import logging
+import os
 from queue import Queue
-from typing import Tuple
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+def default_queue_maxsize() -> int:
+    """Default queue depth scaled to the machine: 128 items per CPU core, at least 1000.
+    
+    More cores mean more worker threads draining the work queue, so a fixed
+    depth would leave the producer blocked more often on larger machines.
+    """
+    return max(1000, (os.cpu_count() or 2) * 128)
+
+
 class QueueManager:
     """Manages queues for parallel processing with backpressure.
     
@@ -20,21 +30,21 @@ class QueueManager:
     Backpressure is provided by maxsize limits on queues.
     """
     
-    def __init__(self, work_queue_maxsize: int = 1000, results_queue_maxsize: int = 1000):
+    def __init__(self, work_queue_maxsize: Optional[int] = None, results_queue_maxsize: Optional[int] = None):
         """Initialize queue manager.
         
         Args:
-            work_queue_maxsize: Maximum size of work queue (backpressure limit)
-            results_queue_maxsize: Maximum size of results queue (backpressure limit)
+            work_queue_maxsize: Maximum size of work queue (backpressure limit, default: default_queue_maxsize())
+            results_queue_maxsize: Maximum size of results queue (backpressure limit, default: default_queue_maxsize())
         """
-        self.work_queue_maxsize = work_queue_maxsize
-        self.results_queue_maxsize = results_queue_maxsize
+        self.work_queue_maxsize = work_queue_maxsize if work_queue_maxsize is not None else default_queue_maxsize()
+        self.results_queue_maxsize = results_queue_maxsize if results_queue_maxsize is not None else default_queue_maxsize()
         
         self.work_queue: Queue = None
         self.results_queue: Queue = None
         
         logger.info(
-            f"Initialized QueueManager: {{'work_maxsize': {work_queue_maxsize}, 'results_maxsize': {results_queue_maxsize}}}"
+            f"Initialized QueueManager: {{'work_maxsize': {self.work_queue_maxsize}, 'results_maxsize': {self.results_queue_maxsize}}}"
         )
     
     def create_queues(self) -> Tuple[Queue, Queue]:
@@ -183,11 +183,13 @@ def worker_thread_main(
                         error_count += 1
                     else:
                         # Coordinate metadata (parse JSON, aggregate)
+                        # Reuse the sidecar fingerprint from the unchanged-file check
                         media_item_record, people_names = coordinate_metadata(
                             file_info=file_info,
                             metadata_ext=metadata_ext,
                             album_id=album_id,
                             scan_run_id=scan_run_id,
+                            sidecar_fingerprint=sidecar_fingerprint,
                         )
                         
                         results_queue.put({
@@ -24,7 +24,7 @@ from .dal.media_items import MediaItemDAL
 from .dal.scan_runs import ScanRunDAL
 from .database import DatabaseConnection
 from .discovery import discover_files
-from .parallel.queue_manager import QueueManager
+from .parallel.queue_manager import QueueManager, default_queue_maxsize
 from .parallel.worker_thread import worker_thread_main
 from .parallel.writer_thread import writer_thread_main
 from .progress import ProgressTracker
@@ -45,7 +45,7 @@ class ParallelScanner:
     - worker_processes: M = CPU cores (default)
     - worker_threads: N = 2 × CPU cores (default)
     - batch_size: Records per database transaction (default: 100)
-    - queue_maxsize: Queue size limit for backpressure (default: 1000)
+    - queue_maxsize: Queue size limit for backpressure (default: 128 × CPU cores, minimum 1000)
     """
     
     def __init__(
@@ -54,7 +54,7 @@ class ParallelScanner:
         worker_processes: Optional[int] = None,
         worker_threads: Optional[int] = None,
         batch_size: int = 100,
-        queue_maxsize: int = 1000,
+        queue_maxsize: Optional[int] = None,
         use_exiftool: bool = False,
         use_ffprobe: bool = False,
     ):
@@ -65,13 +65,13 @@ class ParallelScanner:
             worker_processes: Number of worker processes (default: CPU count)
             worker_threads: Number of worker threads (default: 2 × CPU count)
             batch_size: Database batch size
-            queue_maxsize: Queue size limit
+            queue_maxsize: Queue size limit (default: 128 × CPU cores, minimum 1000)
             use_exiftool: Whether to use exiftool for EXIF
             use_ffprobe: Whether to use ffprobe for video metadata
         """
         self.db_path = db_path
         self.batch_size = batch_size
-        self.queue_maxsize = queue_maxsize
+        self.queue_maxsize = queue_maxsize if queue_maxsize is not None else default_queue_maxsize()
         self.use_exiftool = use_exiftool
         self.use_ffprobe = use_ffprobe
         
@@ -94,7 +94,7 @@ class ParallelScanner:
         
         logger.info(
             f"Initialized ParallelScanner: {{'processes': {self.worker_processes}, 'threads': {self.worker_threads}, "
-            f"'batch_size': {batch_size}, 'queue_maxsize': {queue_maxsize}}}"
+            f"'batch_size': {batch_size}, 'queue_maxsize': {self.queue_maxsize}}}"
         )
     
     def scan(self, target_media_path: Path) -> dict:
@@ -292,11 +292,12 @@ class ParallelScanner:
             logger.info(f"  Unprocessed: {len(unprocessed_media)} media, {len(unprocessed_sidecars)} sidecars, {len(unprocessed_metadata)} metadata, {len(unprocessed_other)} other")
             
             # Log phase-by-phase matching results
+            phase_counts = discovery_result.phase_counts()
             logger.info(f"Matching algorithm results:")
-            logger.info(f"  Phase 1 (Happy path): {len(discovery_result.matched_phase1)} matches")
-            logger.info(f"  Phase 2 (Numbered files): {len(discovery_result.matched_phase2)} matches")
-            logger.info(f"  Phase 3 (Edited files): {len(discovery_result.matched_phase3)} matches")
-            logger.info(f"  Phase 4 (Prefix matching): {len(discovery_result.matched_phase4)} matches")
+            logger.info(f"  Phase 1 (Happy path): {phase_counts[1]} matches")
+            logger.info(f"  Phase 2 (Numbered files): {phase_counts[2]} matches")
+            logger.info(f"  Phase 3 (Edited files): {phase_counts[3]} matches")
+            logger.info(f"  Phase 4 (Prefix matching): {phase_counts[4]} matches")
             logger.info(f"  Unmatched media: {len(discovery_result.unmatched_media)} files")
             logger.info(f"  Unmatched sidecars: {len(discovery_result.unmatched_sidecars)} files")
             
@@ -326,10 +327,10 @@ class ParallelScanner:
                     "discovered_sidecars": len(discovery_result.discovered_sidecars),
                     "discovered_metadata": len(discovery_result.discovered_metadata),
                     "discovered_other": len(discovery_result.discovered_other),
-                    "matched_phase1": len(discovery_result.matched_phase1),
-                    "matched_phase2": len(discovery_result.matched_phase2),
-                    "matched_phase3": len(discovery_result.matched_phase3),
-                    "matched_phase4": len(discovery_result.matched_phase4),
+                    "matched_phase1": phase_counts[1],
+                    "matched_phase2": phase_counts[2],
+                    "matched_phase3": phase_counts[3],
+                    "matched_phase4": phase_counts[4],
                     "unmatched_media": len(discovery_result.unmatched_media),
                     "unmatched_sidecars": len(discovery_result.unmatched_sidecars),
                 }
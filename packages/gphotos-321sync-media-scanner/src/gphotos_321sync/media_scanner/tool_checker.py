@@ -1,5 +1,6 @@
 """Tool availability checker for external dependencies."""
 
+import functools
 import shutil
 import subprocess
 import logging
@@ -10,15 +11,9 @@ from .errors import ToolNotFoundError
 logger = logging.getLogger(__name__)
 
 
-def check_tool_availability() -> Dict[str, bool]:
-    """
-    Check availability of external tools for metadata extraction.
-    
-    Returns:
-        Dictionary mapping tool names to availability status:
-        - 'ffprobe': For video metadata extraction (optional)
-        - 'exiftool': For RAW format EXIF extraction (optional)
-    """
+@functools.cache
+def _probe_tools() -> Dict[str, bool]:
+    """Scan PATH for external tools once per process."""
     tools = {}
     
     # Check ffprobe (part of ffmpeg) - optional for video metadata
@@ -30,6 +25,26 @@ def check_tool_availability() -> Dict[str, bool]:
     return tools
 
 
+def check_tool_availability() -> Dict[str, bool]:
+    """
+    Check availability of external tools for metadata extraction.
+    
+    PATH is scanned on the first call only; later calls return a copy of
+    the cached result. Call ``check_tool_availability.cache_clear()`` to
+    force a rescan.
+    
+    Returns:
+        Dictionary mapping tool names to availability status:
+        - 'ffprobe': For video metadata extraction (optional)
+        - 'exiftool': For RAW format EXIF extraction (optional)
+    """
+    return dict(_probe_tools())
+
+
+# Callers reset the PATH scan through the public function, as with functools.cache
+check_tool_availability.cache_clear = _probe_tools.cache_clear
+
+
 def _require_tool(tool_name: str) -> None:
     """
     Raise error if a tool is not available.
@@ -0,0 +1,200 @@
+"""Shared fixtures for media scanner tests."""
+
+import dataclasses
+import io
+import pytest
+import sqlite3
+import uuid
+from importlib.resources import files
+from pathlib import Path
+from typing import Final
+from PIL import Image, ExifTags
+
+from gphotos_321sync.media_scanner.database import DatabaseConnection
+from gphotos_321sync.media_scanner.discovery import BatchMatchingResult, DiscoveryResult
+from gphotos_321sync.media_scanner.migrations import MigrationRunner
+
+
+# Basic EXIF data shared by all EXIF-bearing fixtures
+_EXIF_OBJ = Image.Exif()
+_EXIF_OBJ[ExifTags.Base.Make] = "Canon"
+_EXIF_OBJ[ExifTags.Base.Model] = "EOS 5D"
+_EXIF_OBJ[ExifTags.Base.Orientation] = 1
+
+# Immutable, so one instance can fill every empty tracking-set slot
+_EMPTY_SET: Final = frozenset()
+
+
+class _InMemoryDatabaseConnection(DatabaseConnection):
+    """DatabaseConnection on a named shared-cache in-memory database.
+    
+    Connections opened with the same name share one database, which lives
+    until the last of them closes. No file backs it, so db_path is None.
+    """
+    
+    def __init__(self, name: str):
+        super().__init__(Path(name))
+        self.db_path = None
+        self._uri = f"file:{name}?mode=memory&cache=shared"
+    
+    def connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self._uri, check_same_thread=False, timeout=5.0, uri=True)
+            self._connection.row_factory = sqlite3.Row
+            self._apply_pragmas()
+        return self._connection
+
+
+def _encode_jpeg(img, **save_kwargs) -> bytes:
+    """Encode a PIL image to JPEG bytes in memory."""
+    buffer = io.BytesIO()
+    img.save(buffer, 'JPEG', **save_kwargs)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def red_jpeg_bytes():
+    """Encoded JPEG bytes of a plain test image (encoded once per session)."""
+    img = Image.new('RGB', (8, 8), color='red')
+    return _encode_jpeg(img)
+
+
+@pytest.fixture(scope="session")
+def exif_jpeg_bytes():
+    """Encoded JPEG bytes of a test image with EXIF data (encoded once per session)."""
+    img = Image.new('RGB', (16, 16), color='blue')
+    return _encode_jpeg(img, exif=_EXIF_OBJ)
+
+
+@pytest.fixture(scope="session")
+def bad_files_dir(tmp_path_factory):
+    """Session-wide directory holding the invalid input files."""
+    return tmp_path_factory.mktemp("bad_files")
+
+
+@pytest.fixture(scope="session")
+def corrupted_jpeg_path(bad_files_dir):
+    """JPEG-named file whose content is not a valid image."""
+    path = bad_files_dir / "corrupted.jpg"
+    path.write_bytes(b"This is not a valid image")
+    return path
+
+
+@pytest.fixture(scope="session")
+def non_image_text_path(bad_files_dir):
+    """Plain text file."""
+    path = bad_files_dir / "test.txt"
+    path.write_text("This is not an image")
+    return path
+
+
+@pytest.fixture(scope="session")
+def empty_jpeg_path(bad_files_dir):
+    """Zero-byte JPEG-named file."""
+    path = bad_files_dir / "empty.jpg"
+    path.touch()
+    return path
+
+
+@pytest.fixture(scope="session")
+def directory_path(bad_files_dir):
+    """Directory passed where a file is expected."""
+    path = bad_files_dir / "directory"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture(scope="session")
+def nonexistent_path():
+    """Path that does not exist."""
+    return Path("/nonexistent/file.jpg")
+
+
+@pytest.fixture(scope="session")
+def empty_discovery_result():
+    """DiscoveryResult with no files and every tracking set empty."""
+    return DiscoveryResult(
+        files=[],
+        json_sidecar_count=0,
+        paired_sidecars=_EMPTY_SET,
+        all_sidecars=_EMPTY_SET,
+        matched_by_phase={},
+        unmatched_media=_EMPTY_SET,
+        unmatched_sidecars=_EMPTY_SET,
+        discovered_media=_EMPTY_SET,
+        discovered_sidecars=_EMPTY_SET,
+        discovered_metadata=_EMPTY_SET,
+        discovered_other=_EMPTY_SET
+    )
+
+
+@pytest.fixture(scope="session")
+def make_discovery_result(empty_discovery_result):
+    """Factory building a DiscoveryResult from the empty template plus overrides."""
+    def _make(**overrides):
+        return dataclasses.replace(empty_discovery_result, **overrides)
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_batch_matching_result():
+    """Factory building a BatchMatchingResult with empty defaults plus overrides."""
+    template = BatchMatchingResult(
+        matches={},
+        matched_phase1=_EMPTY_SET,
+        matched_phase2=_EMPTY_SET,
+        matched_phase3=_EMPTY_SET,
+        matched_phase4=_EMPTY_SET,
+        unmatched_media=_EMPTY_SET,
+        unmatched_sidecars=_EMPTY_SET
+    )
+    
+    def _make(**overrides):
+        return dataclasses.replace(template, **overrides)
+    return _make
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _sqlite_without_fsync():
+    """Turn off fsync on every database connection opened by the tests.
+    
+    Patched at the class level so connections opened inside ParallelScanner's
+    threads are covered too. Test databases are thrown away, so durability
+    buys nothing; WAL mode is kept since tests and scanner threads share files.
+    """
+    apply_pragmas = DatabaseConnection._apply_pragmas
+    
+    def _apply_pragmas_without_fsync(self):
+        apply_pragmas(self)
+        self._connection.execute("PRAGMA synchronous=OFF").close()
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(DatabaseConnection, "_apply_pragmas", _apply_pragmas_without_fsync)
+        yield
+
+
+@pytest.fixture
+def in_memory_db():
+    """Empty in-memory database connection, unique to the test."""
+    db = _InMemoryDatabaseConnection(f"test_{uuid.uuid4().hex}")
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="session")
+def schema_dir():
+    """Get the schema directory of the imported media_scanner package, resolved once per session."""
+    return Path(files("gphotos_321sync.media_scanner") / "schema").resolve()
+
+
+@pytest.fixture(scope="session")
+def template_db_path(tmp_path_factory, schema_dir):
+    """Fully migrated database built once per session, copied by tests that need a schema."""
+    db_path = tmp_path_factory.mktemp("db_template") / "template.db"
+    db = DatabaseConnection(db_path)
+    # Throwaway file: skip fsyncs and keep the rollback journal in RAM while building it
+    for pragma in ("PRAGMA synchronous=OFF", "PRAGMA journal_mode=MEMORY", "PRAGMA temp_store=MEMORY"):
+        db.execute(pragma).close()
+    MigrationRunner(db, schema_dir).apply_migrations()
+    db.close()
+    return db_path
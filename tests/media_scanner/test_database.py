@@ -1,7 +1,7 @@
 """Tests for database connection and basic operations."""
 
 import pytest
-import tempfile
+import shutil
 from pathlib import Path
 import uuid
 
@@ -14,11 +14,9 @@ from gphotos_321sync.media_scanner.dal.processing_errors import ProcessingErrorD
 
 
 @pytest.fixture
-def temp_db():
+def temp_db(tmp_path):
     """Create a temporary database for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        yield db_path
+    return tmp_path / "test.db"
 
 
 @pytest.fixture
@@ -31,12 +29,13 @@ def db_connection(temp_db):
 
 
 @pytest.fixture
-def migrated_db(db_connection):
-    """Create a database with migrations applied."""
-    schema_dir = Path(__file__).parent.parent.parent / "packages" / "gphotos-321sync-media-scanner" / "src" / "gphotos_321sync" / "media_scanner" / "schema"
-    runner = MigrationRunner(db_connection, schema_dir)
-    runner.apply_migrations()
-    return db_connection
+def migrated_db(temp_db, template_db_path):
+    """Create a database with migrations applied, copied from the session template."""
+    shutil.copyfile(template_db_path, temp_db)
+    db = DatabaseConnection(temp_db)
+    db.connect()
+    yield db
+    db.close()
 
 
 def test_database_connection(temp_db):
@@ -61,9 +60,8 @@ def test_database_pragmas(db_connection):
     assert result[0] == 5000
 
 
-def test_migration_initial_schema(migrated_db):
+def test_migration_initial_schema(migrated_db, schema_dir):
     """Test that initial schema migration works."""
-    schema_dir = Path(__file__).parent.parent.parent / "packages" / "gphotos-321sync-media-scanner" / "src" / "gphotos_321sync" / "media_scanner" / "schema"
     runner = MigrationRunner(migrated_db, schema_dir)
     version = runner.get_current_version()
     assert version == 1
@@ -22,90 +22,127 @@ from gphotos_321sync.media_scanner.discovery import (
 class TestCollectFiles:
     """Test the _collect_files helper function."""
     
-    def test_collect_files_basic(self):
+    def test_collect_files_basic(self, tmp_path):
         """Test basic file collection functionality."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create an album directory (simulate Google Photos structure)
-            album_dir = temp_path / "Photos from 2024"
-            album_dir.mkdir()
-            
-            # Create test files inside the album
-            (album_dir / "photo1.jpg").touch()
-            (album_dir / "photo2.png").touch()
-            (album_dir / "photo1.json").touch()
-            (album_dir / "metadata.json").touch()  # Should be skipped
-            
-            media_files, json_files, all_files = _collect_files(temp_path)
-            
-            assert len(media_files) == 2
-            assert len(json_files) == 1
-            assert len(all_files) == 1
-            assert album_dir in all_files
-            assert "photo1.jpg" in all_files[album_dir]
-            assert "photo2.png" in all_files[album_dir]
-            assert "photo1.json" in all_files[album_dir]
-            assert "metadata.json" in all_files[album_dir]
+        # Create an album directory (simulate Google Photos structure)
+        album_dir = tmp_path / "Photos from 2024"
+        album_dir.mkdir()
+        
+        # Create test files inside the album
+        (album_dir / "photo1.jpg").touch()
+        (album_dir / "photo2.png").touch()
+        (album_dir / "photo1.json").touch()
+        (album_dir / "metadata.json").touch()  # Should be skipped
+        
+        media_files, json_files, all_files = _collect_files(tmp_path)
+        
+        assert len(media_files) == 2
+        assert len(json_files) == 1
+        assert len(all_files) == 1
+        assert album_dir in all_files
+        assert "photo1.jpg" in all_files[album_dir]
+        assert "photo2.png" in all_files[album_dir]
+        assert "photo1.json" in all_files[album_dir]
+        assert "metadata.json" in all_files[album_dir]
     
-    def test_collect_files_nested(self):
+    def test_collect_files_nested(self, tmp_path):
         """Test file collection in nested directories."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create album directories (simulate Google Photos structure)
-            album1 = temp_path / "Photos from 2023"
-            album2 = temp_path / "Photos from 2024"
-            album1.mkdir()
-            album2.mkdir()
-            
-            # Create files inside albums
-            (album1 / "photo1.jpg").touch()
-            (album1 / "photo1.json").touch()
-            (album2 / "photo2.png").touch()
-            (album2 / "photo2.json").touch()
-            
-            media_files, json_files, all_files = _collect_files(temp_path)
-            
-            assert len(media_files) == 2
-            assert len(json_files) == 2
-            assert len(all_files) == 2
+        # Create album directories (simulate Google Photos structure)
+        album1 = tmp_path / "Photos from 2023"
+        album2 = tmp_path / "Photos from 2024"
+        album1.mkdir()
+        album2.mkdir()
+        
+        # Create files inside albums
+        (album1 / "photo1.jpg").touch()
+        (album1 / "photo1.json").touch()
+        (album2 / "photo2.png").touch()
+        (album2 / "photo2.json").touch()
+        
+        media_files, json_files, all_files = _collect_files(tmp_path)
+        
+        assert len(media_files) == 2
+        assert len(json_files) == 2
+        assert len(all_files) == 2
+    
+    def test_collect_files_does_not_follow_symlinked_dirs(self, tmp_path):
+        """Test that symlinked directories are not descended into."""
+        album = tmp_path / "Photos from 2024"
+        album.mkdir()
+        (album / "photo.jpg").touch()
+        (tmp_path / "link").symlink_to(album, target_is_directory=True)
+        
+        media_files, json_files, all_files = _collect_files(tmp_path)
+        
+        assert media_files == [album / "photo.jpg"]
+        assert list(all_files) == [album]
+    
+    def test_collect_files_many_albums(self, tmp_path):
+        """Test that albums walked concurrently yield the same files as rglob."""
+        for i in range(10):
+            album = tmp_path / f"Album {i}"
+            (album / "nested").mkdir(parents=True)
+            (album / f"photo{i}.jpg").touch()
+            (album / f"photo{i}.jpg.supplemental-metadata.json").touch()
+            (album / "nested" / f"clip{i}.mp4").touch()
+        
+        media_files, json_files, all_files = _collect_files(tmp_path)
+        
+        assert set(media_files) == {p for p in tmp_path.rglob("*") if p.suffix in (".jpg", ".mp4")}
+        assert set(json_files) == set(tmp_path.rglob("*.json"))
+        assert len(all_files) == 20
 
 
 class TestCreateFileInfo:
     """Test the _create_file_info_from_batch_result helper function."""
     
-    def test_create_file_info_basic(self):
+    def test_create_file_info_basic(self, tmp_path):
         """Test basic file info creation using batch approach."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            media_file = temp_path / "photo.jpg"
-            media_file.touch()
-            
-            # Create sidecar file
-            sidecar_file = temp_path / "photo.jpg.supplemental-metadata.json"
-            sidecar_file.touch()
-            
-            # Use the new batch approach
-            media_files = [media_file]
-            sidecar_index = {
-                "photo.jpg": [ParsedSidecar(
-                    filename="photo",
-                    extension="jpg",
-                    numeric_suffix="",
-                    full_sidecar_path=sidecar_file
-                )]
-            }
-            
-            batch_results = _match_media_to_sidecar_batch(media_files, sidecar_index)
-            file_info = _create_file_info_from_batch_result(media_file, temp_path, batch_results.matches[media_file])
-            
-            assert file_info.file_path == media_file
-            assert file_info.relative_path == Path("photo.jpg")
-            assert file_info.album_folder_path == Path(".")
-            assert file_info.json_sidecar_path == sidecar_file
-            assert file_info.file_size == 0
+        media_file = tmp_path / "photo.jpg"
+        media_file.touch()
+        
+        # Create sidecar file
+        sidecar_file = tmp_path / "photo.jpg.supplemental-metadata.json"
+        sidecar_file.touch()
+        
+        # Use the new batch approach
+        media_files = [media_file]
+        sidecar_index = {
+            "photo.jpg": [ParsedSidecar(
+                filename="photo",
+                extension="jpg",
+                numeric_suffix="",
+                full_sidecar_path=sidecar_file
+            )]
+        }
+        
+        batch_results = _match_media_to_sidecar_batch(media_files, sidecar_index)
+        file_info = _create_file_info_from_batch_result(media_file, tmp_path, batch_results.matches[media_file])
+        
+        assert file_info.file_path == media_file
+        assert file_info.relative_path == Path("photo.jpg")
+        assert file_info.album_folder_path == Path(".")
+        assert file_info.json_sidecar_path == sidecar_file
+        assert file_info.file_size == 0
     
+    def test_create_file_info_uses_known_size(self, tmp_path):
+        """Test that a size known from discovery is used without stat'ing the file."""
+        media_file = tmp_path / "photo.jpg"
+        
+        file_info = _create_file_info_from_batch_result(media_file, tmp_path, None, 1234)
+        
+        assert file_info.file_size == 1234
+    
+    def test_create_file_info_relative_paths(self, tmp_path):
+        """Test relative and album paths for nested files and files outside the scan root."""
+        nested = _create_file_info_from_batch_result(tmp_path / "Album" / "Sub" / "photo.jpg", tmp_path, None, 0)
+        assert nested.relative_path == Path("Album/Sub/photo.jpg")
+        assert nested.album_folder_path == Path("Album/Sub")
+        
+        # Sibling directory sharing the root's name as a prefix is not under the root
+        outside = _create_file_info_from_batch_result(Path(f"{tmp_path}2") / "photo.jpg", tmp_path, None, 0)
+        assert outside.relative_path == Path("photo.jpg")
+        assert outside.album_folder_path == Path(".")
 
 
 class TestParseSidecarFilename:
@@ -419,36 +456,33 @@ class TestMatchMediaToSidecarBatch:
 class TestDiscoverFiles:
     """Test the main discover_files function."""
     
-    def test_discover_files_basic(self):
+    def test_discover_files_basic(self, tmp_path):
         """Test basic file discovery."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create Google Photos structure
-            google_photos = temp_path / "Takeout" / "Google Photos"
-            google_photos.mkdir(parents=True)
-            
-            # Create an album directory
-            album_dir = google_photos / "Photos from 2024"
-            album_dir.mkdir()
-            
-            # Create test files inside the album with proper Google Takeout sidecar naming
-            (album_dir / "photo1.jpg").touch()
-            (album_dir / "photo2.png").touch()
-            (album_dir / "photo1.jpg.supplemental-metadata.json").touch()
-            
-            files = discover_files(temp_path)
-            
-            assert len(files.files) == 2  # Both photo1.jpg (matched) and photo2.png (unmatched) should be processed
-            assert files.files[0].file_path.name == "photo1.jpg"
-            assert files.files[0].json_sidecar_path.name == "photo1.jpg.supplemental-metadata.json"
-            assert len(files.unmatched_media) == 1  # photo2.png has no sidecar
-            assert "photo2.png" in [f.name for f in files.unmatched_media]
-            assert all(isinstance(f, FileInfo) for f in files.files)
-            
-            # Check that one file has a sidecar
-            files_with_sidecars = [f for f in files.files if f.json_sidecar_path]
-            assert len(files_with_sidecars) == 1
+        # Create Google Photos structure
+        google_photos = tmp_path / "Takeout" / "Google Photos"
+        google_photos.mkdir(parents=True)
+        
+        # Create an album directory
+        album_dir = google_photos / "Photos from 2024"
+        album_dir.mkdir()
+        
+        # Create test files inside the album with proper Google Takeout sidecar naming
+        (album_dir / "photo1.jpg").touch()
+        (album_dir / "photo2.png").touch()
+        (album_dir / "photo1.jpg.supplemental-metadata.json").touch()
+        
+        files = discover_files(tmp_path)
+        
+        assert len(files.files) == 2  # Both photo1.jpg (matched) and photo2.png (unmatched) should be processed
+        assert files.files[0].file_path.name == "photo1.jpg"
+        assert files.files[0].json_sidecar_path.name == "photo1.jpg.supplemental-metadata.json"
+        assert len(files.unmatched_media) == 1  # photo2.png has no sidecar
+        assert "photo2.png" in [f.name for f in files.unmatched_media]
+        assert all(isinstance(f, FileInfo) for f in files.files)
+        
+        # Check that one file has a sidecar
+        files_with_sidecars = [f for f in files.files if f.json_sidecar_path]
+        assert len(files_with_sidecars) == 1
     
     def test_discover_files_nonexistent_path(self):
         """Test discovery with nonexistent path."""
@@ -466,64 +500,74 @@ class TestDiscoverFiles:
             files = discover_files(temp_path)
             
             assert len(files.files) == 0
+    
+    def test_discover_files_pairs_sidecars_within_album(self, tmp_path):
+        """Test that same-named files in different albums pair with their own sidecars."""
+        google_photos = tmp_path / "Takeout" / "Google Photos"
+        for album_name in ("Album A", "Album B"):
+            album_dir = google_photos / album_name
+            album_dir.mkdir(parents=True)
+            (album_dir / "IMG_0001.jpg").touch()
+            (album_dir / "IMG_0001.jpg.supplemental-metadata.json").touch()
+        
+        result = discover_files(tmp_path)
+        
+        assert len(result.files) == 2
+        for file_info in result.files:
+            assert file_info.json_sidecar_path.parent == file_info.file_path.parent
+        assert result.unmatched_sidecars == set()
 
 
 class TestRefactoredFunctionality:
     """Test that refactored functions work together correctly."""
     
-    def test_refactored_discover_files_structure(self):
+    def test_refactored_discover_files_structure(self, tmp_path):
         """Test that the refactored discover_files maintains the same interface."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create Google Photos structure
-            google_photos = temp_path / "Takeout" / "Google Photos"
-            google_photos.mkdir(parents=True)
-            
-            # Create an album directory
-            album_dir = google_photos / "Photos from 2024"
-            album_dir.mkdir()
-            
-            # Create test files inside the album with proper Google Takeout sidecar naming
-            (album_dir / "photo1.jpg").touch()
-            (album_dir / "photo2.png").touch()
-            (album_dir / "photo1.jpg.supplemental-metadata.json").touch()
-            
-            # Test that the function returns DiscoveryResult
-            result = discover_files(temp_path)
-            
-            assert isinstance(result, DiscoveryResult)
-            assert len(result.files) == 2  # Both photo1.jpg (matched) and photo2.png (unmatched) should be processed
-            assert all(isinstance(f, FileInfo) for f in result.files)
-            
-            # Test that FileInfo objects have all required attributes
-            for file_info in result.files:
-                assert hasattr(file_info, 'file_path')
-                assert hasattr(file_info, 'relative_path')
-                assert hasattr(file_info, 'album_folder_path')
-                assert hasattr(file_info, 'json_sidecar_path')
-                assert hasattr(file_info, 'file_size')
+        # Create Google Photos structure
+        google_photos = tmp_path / "Takeout" / "Google Photos"
+        google_photos.mkdir(parents=True)
+        
+        # Create an album directory
+        album_dir = google_photos / "Photos from 2024"
+        album_dir.mkdir()
+        
+        # Create test files inside the album with proper Google Takeout sidecar naming
+        (album_dir / "photo1.jpg").touch()
+        (album_dir / "photo2.png").touch()
+        (album_dir / "photo1.jpg.supplemental-metadata.json").touch()
+        
+        # Test that the function returns DiscoveryResult
+        result = discover_files(tmp_path)
+        
+        assert isinstance(result, DiscoveryResult)
+        assert len(result.files) == 2  # Both photo1.jpg (matched) and photo2.png (unmatched) should be processed
+        assert all(isinstance(f, FileInfo) for f in result.files)
+        
+        # Test that FileInfo objects have all required attributes
+        for file_info in result.files:
+            assert hasattr(file_info, 'file_path')
+            assert hasattr(file_info, 'relative_path')
+            assert hasattr(file_info, 'album_folder_path')
+            assert hasattr(file_info, 'json_sidecar_path')
+            assert hasattr(file_info, 'file_size')
     
-    def test_refactored_performance(self):
+    def test_refactored_performance(self, tmp_path):
         """Test that refactored functions maintain performance characteristics."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create Google Photos structure
-            google_photos = temp_path / "Takeout" / "Google Photos"
-            google_photos.mkdir(parents=True)
-            
-            # Create an album directory
-            album_dir = google_photos / "Photos from 2024"
-            album_dir.mkdir()
-            
-            # Create multiple test files inside the album with proper Google Takeout sidecar naming
-            for i in range(10):
-                (album_dir / f"photo{i}.jpg").touch()
-                (album_dir / f"photo{i}.jpg.supplemental-metadata.json").touch()
-            
-            # Test that discovery still works efficiently
-            result = discover_files(temp_path)
-            
-            assert len(result.files) == 10
-            assert all(f.json_sidecar_path is not None for f in result.files)
\ No newline at end of file
+        # Create Google Photos structure
+        google_photos = tmp_path / "Takeout" / "Google Photos"
+        google_photos.mkdir(parents=True)
+        
+        # Create an album directory
+        album_dir = google_photos / "Photos from 2024"
+        album_dir.mkdir()
+        
+        # Create multiple test files inside the album with proper Google Takeout sidecar naming
+        for i in range(10):
+            (album_dir / f"photo{i}.jpg").touch()
+            (album_dir / f"photo{i}.jpg.supplemental-metadata.json").touch()
+        
+        # Test that discovery still works efficiently
+        result = discover_files(tmp_path)
+        
+        assert len(result.files) == 10
+        assert all(f.json_sidecar_path is not None for f in result.files)
\ No newline at end of file
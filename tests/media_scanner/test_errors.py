@@ -34,9 +34,10 @@ class TestErrorInheritance:
             ToolNotFoundError("test"),
         ]
         
+        # ScannerError derives from GPSyncError (checked above), so this also
+        # covers the GPSyncError ancestry
         for error in errors:
             assert isinstance(error, ScannerError)
-            assert isinstance(error, GPSyncError)
     
     def test_error_message_preservation(self):
         """Test that error messages are preserved."""
@@ -48,73 +49,70 @@ class TestErrorInheritance:
         assert str(specific_error) == message
 
 
+# Exact error type -> expected category
+_EXPECTED = {
+    PermissionDeniedError: 'permission',
+    CorruptedFileError: 'corrupted',
+    IOError: 'io',
+    ParseError: 'parse',
+    UnsupportedFormatError: 'unsupported',
+    ToolNotFoundError: 'tool_missing',
+    PermissionError: 'permission',
+    OSError: 'io',
+    ValueError: 'parse',
+    KeyError: 'parse',
+    AttributeError: 'parse',
+}
+
+CLASSIFY_ERROR_CASES = [
+    *_EXPECTED.items(),
+    # Subclasses resolve through their closest classified ancestor
+    (FileNotFoundError, 'io'),
+    (UnicodeError, 'parse'),
+    (RuntimeError, 'unknown'),
+    # None should not happen in practice, but classification must stay robust
+    (None, 'unknown'),
+]
+
+
 class TestClassifyError:
     """Tests for classify_error function."""
     
-    def test_classify_permission_denied_error(self):
-        """Test classification of PermissionDeniedError."""
-        error = PermissionDeniedError("Access denied")
-        assert classify_error(error) == 'permission'
-    
-    def test_classify_corrupted_file_error(self):
-        """Test classification of CorruptedFileError."""
-        error = CorruptedFileError("File corrupted")
-        assert classify_error(error) == 'corrupted'
-    
-    def test_classify_io_error(self):
-        """Test classification of IOError."""
-        error = IOError("I/O failed")
-        assert classify_error(error) == 'io'
-    
-    def test_classify_parse_error(self):
-        """Test classification of ParseError."""
-        error = ParseError("Parse failed")
-        assert classify_error(error) == 'parse'
-    
-    def test_classify_unsupported_format_error(self):
-        """Test classification of UnsupportedFormatError."""
-        error = UnsupportedFormatError("Format not supported")
-        assert classify_error(error) == 'unsupported'
-    
-    def test_classify_tool_not_found_error(self):
-        """Test classification of ToolNotFoundError."""
-        error = ToolNotFoundError("Tool missing")
-        assert classify_error(error) == 'tool_missing'
-    
-    def test_classify_builtin_permission_error(self):
-        """Test classification of built-in PermissionError."""
-        error = PermissionError("Access denied")
-        assert classify_error(error) == 'permission'
-    
-    def test_classify_builtin_os_error(self):
-        """Test classification of built-in OSError."""
-        error = OSError("OS error")
-        assert classify_error(error) == 'io'
-    
-    def test_classify_builtin_value_error(self):
-        """Test classification of built-in ValueError."""
-        error = ValueError("Invalid value")
-        assert classify_error(error) == 'parse'
-    
-    def test_classify_builtin_key_error(self):
-        """Test classification of built-in KeyError."""
-        error = KeyError("Missing key")
-        assert classify_error(error) == 'parse'
-    
-    def test_classify_builtin_attribute_error(self):
-        """Test classification of built-in AttributeError."""
-        error = AttributeError("Missing attribute")
-        assert classify_error(error) == 'parse'
-    
-    def test_classify_unknown_error(self):
-        """Test classification of unknown error types."""
-        error = RuntimeError("Unknown error")
-        assert classify_error(error) == 'unknown'
-    
-    def test_classify_none_error(self):
-        """Test classification of None (should not happen in practice)."""
-        # This should not happen in practice, but test robustness
-        assert classify_error(None) == 'unknown'
+    @pytest.mark.parametrize(
+        "error_cls,expected_category",
+        CLASSIFY_ERROR_CASES,
+        ids=lambda case: case.__name__ if isinstance(case, type) else str(case),
+    )
+    def test_classify_error(self, error_cls, expected_category):
+        """Test classification of scanner, built-in and unknown errors."""
+        error = error_cls("test") if error_cls else None
+        assert classify_error(error) == expected_category
+
+
+# Database error categories allowed by the CHECK constraint in the schema
+_EXPECTED_DB_CATEGORIES = frozenset({
+    'permission_denied',
+    'corrupted',
+    'io_error',
+    'parse_error',
+    'unsupported_format',
+})
+
+# Map classify_error categories to database categories
+_CATEGORY_MAPPING = {
+    'permission': 'permission_denied',
+    'corrupted': 'corrupted',
+    'io': 'io_error',
+    'parse': 'parse_error',
+    'unsupported': 'unsupported_format',
+    'tool_missing': 'unsupported_format',  # Tool missing maps to unsupported
+    'unknown': 'parse_error'  # Unknown maps to parse_error as fallback
+}
+
+_VALID_CATEGORIES = frozenset({
+    'permission', 'corrupted', 'io', 'parse',
+    'unsupported', 'tool_missing', 'unknown'
+})
 
 
 class TestErrorCategories:
@@ -122,15 +120,6 @@ class TestErrorCategories:
     
     def test_error_categories_match_database_schema(self):
         """Test that error categories match database schema constraints."""
-        # These categories should match the CHECK constraint in the database schema
-        expected_categories = {
-            'permission_denied',
-            'corrupted', 
-            'io_error',
-            'parse_error',
-            'unsupported_format'
-        }
-        
         # Test that our classification function returns valid categories
         test_cases = [
             (PermissionDeniedError("test"), 'permission'),
@@ -142,19 +131,8 @@ class TestErrorCategories:
         
         for error, expected_category in test_cases:
             actual_category = classify_error(error)
-            # Map our internal categories to database categories
-            category_mapping = {
-                'permission': 'permission_denied',
-                'corrupted': 'corrupted',
-                'io': 'io_error',
-                'parse': 'parse_error',
-                'unsupported': 'unsupported_format',
-                'tool_missing': 'unsupported_format',  # Tool missing maps to unsupported
-                'unknown': 'parse_error'  # Unknown maps to parse_error as fallback
-            }
-            
-            db_category = category_mapping.get(actual_category, 'parse_error')
-            assert db_category in expected_categories
+            db_category = _CATEGORY_MAPPING.get(actual_category, 'parse_error')
+            assert db_category in _EXPECTED_DB_CATEGORIES
     
     def test_error_category_completeness(self):
         """Test that all error types have valid categories."""
@@ -167,15 +145,10 @@ class TestErrorCategories:
             ToolNotFoundError,
         ]
         
-        valid_categories = {
-            'permission', 'corrupted', 'io', 'parse', 
-            'unsupported', 'tool_missing', 'unknown'
-        }
-        
         for error_type in error_types:
             error = error_type("test")
             category = classify_error(error)
-            assert category in valid_categories
+            assert category in _VALID_CATEGORIES
 
 
 class TestErrorHandlingIntegration:
@@ -189,8 +162,8 @@ class TestErrorHandlingIntegration:
             except PermissionError as e:
                 raise PermissionDeniedError("High level permission error") from e
         except PermissionDeniedError as e:
-            assert isinstance(e, ScannerError)
-            assert isinstance(e, GPSyncError)
+            assert type(e) is PermissionDeniedError
+            assert type(e.__cause__) is PermissionError
             assert classify_error(e) == 'permission'
     
     def test_error_context_preservation(self):
@@ -239,7 +212,7 @@ class TestErrorEdgeCases:
         long_message = "A" * 10000
         error = CorruptedFileError(long_message)
         
-        assert len(str(error)) == 10000
+        assert len(error.args[0]) == 10000
         assert classify_error(error) == 'corrupted'
     
     def test_unicode_error_message(self):
@@ -259,4 +232,4 @@ class TestErrorEdgeCases:
                 raise ParseError("Outer error") from e
         except ParseError as e:
             assert classify_error(e) == 'parse'
-            assert isinstance(e.__cause__, ValueError)
+            assert type(e.__cause__) is ValueError
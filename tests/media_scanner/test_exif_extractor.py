@@ -1,9 +1,8 @@
 """Tests for EXIF extractor."""
 
+import io
 import pytest
-import tempfile
-from pathlib import Path
-from PIL import Image, ExifTags
+from PIL import Image
 
 from gphotos_321sync.media_scanner.metadata.exif_extractor import (
     extract_exif,
@@ -12,43 +11,29 @@ from gphotos_321sync.media_scanner.metadata.exif_extractor import (
 
 
 @pytest.fixture
-def temp_image():
+def temp_image(tmp_path, red_jpeg_bytes):
     """Create a temporary test image."""
-    with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as f:
-        temp_path = Path(f.name)
-    
-    # Create a simple test image
-    img = Image.new('RGB', (800, 600), color='red')
-    img.save(temp_path, 'JPEG')
-    
-    yield temp_path
-    temp_path.unlink(missing_ok=True)
+    temp_path = tmp_path / "red.jpg"
+    temp_path.write_bytes(red_jpeg_bytes)
+    return temp_path
 
 
 @pytest.fixture
-def temp_image_with_exif():
+def temp_image_with_exif(tmp_path, exif_jpeg_bytes):
     """Create a temporary test image with EXIF data."""
-    with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as f:
-        temp_path = Path(f.name)
-    
-    # Create image with EXIF data
-    img = Image.new('RGB', (1920, 1080), color='blue')
-    
-    # Add basic EXIF data
-    exif_dict = {
-        ExifTags.Base.Make: "Canon",
-        ExifTags.Base.Model: "EOS 5D",
-        ExifTags.Base.Orientation: 1,
-    }
-    
-    exif = Image.Exif()
-    for tag, value in exif_dict.items():
-        exif[tag] = value
-    
-    img.save(temp_path, 'JPEG', exif=exif)
-    
-    yield temp_path
-    temp_path.unlink(missing_ok=True)
+    temp_path = tmp_path / "exif.jpg"
+    temp_path.write_bytes(exif_jpeg_bytes)
+    return temp_path
+
+
+# Fixture names of inputs the extractors must handle gracefully
+BAD_PATH_FIXTURES = [
+    "nonexistent_path",
+    "non_image_text_path",
+    "corrupted_jpeg_path",
+    "directory_path",
+    "empty_jpeg_path",
+]
 
 
 class TestExtractExif:
@@ -80,32 +65,11 @@ class TestExtractExif:
         if 'camera_model' in result:
             assert result['camera_model'] == "EOS 5D"
     
-    def test_extract_exif_nonexistent_file(self):
-        """Test extracting EXIF from nonexistent file."""
-        nonexistent_path = Path("/nonexistent/file.jpg")
-        result = extract_exif(nonexistent_path)
-        
-        # Should return empty dict or None for nonexistent files
-        assert result is None or result == {}
-    
-    def test_extract_exif_non_image_file(self, tmp_path):
-        """Test extracting EXIF from non-image file."""
-        text_file = tmp_path / "test.txt"
-        text_file.write_text("This is not an image")
-        
-        result = extract_exif(text_file)
-        
-        # Should handle non-image files gracefully
-        assert result is None or result == {}
-    
-    def test_extract_exif_corrupted_image(self, tmp_path):
-        """Test extracting EXIF from corrupted image."""
-        corrupted_file = tmp_path / "corrupted.jpg"
-        corrupted_file.write_bytes(b"This is not a valid image")
-        
-        result = extract_exif(corrupted_file)
+    @pytest.mark.parametrize("bad_path_fixture", BAD_PATH_FIXTURES)
+    def test_extract_exif_handles_bad_path(self, request, bad_path_fixture):
+        """Test that extract_exif handles missing, invalid and non-file paths gracefully."""
+        result = extract_exif(request.getfixturevalue(bad_path_fixture))
         
-        # Should handle corrupted images gracefully
         assert result is None or result == {}
 
 
@@ -118,7 +82,7 @@ class TestExtractResolution:
         
         assert isinstance(result, tuple)
         assert len(result) == 2
-        assert result == (800, 600)
+        assert result == (8, 8)
     
     def test_extract_resolution_with_exif(self, temp_image_with_exif):
         """Test extracting resolution from image with EXIF."""
@@ -126,93 +90,29 @@ class TestExtractResolution:
         
         assert isinstance(result, tuple)
         assert len(result) == 2
-        assert result == (1920, 1080)
-    
-    def test_extract_resolution_nonexistent_file(self):
-        """Test extracting resolution from nonexistent file."""
-        nonexistent_path = Path("/nonexistent/file.jpg")
-        result = extract_resolution(nonexistent_path)
-        
-        # Should return None for nonexistent files
-        assert result is None
+        assert result == (16, 16)
     
-    def test_extract_resolution_non_image_file(self, tmp_path):
-        """Test extracting resolution from non-image file."""
-        text_file = tmp_path / "test.txt"
-        text_file.write_text("This is not an image")
+    @pytest.mark.parametrize("bad_path_fixture", BAD_PATH_FIXTURES)
+    def test_extract_resolution_handles_bad_path(self, request, bad_path_fixture):
+        """Test that extract_resolution returns None for missing, invalid and non-file paths."""
+        result = extract_resolution(request.getfixturevalue(bad_path_fixture))
         
-        result = extract_resolution(text_file)
-        
-        # Should return None for non-image files
-        assert result is None
-    
-    def test_extract_resolution_corrupted_image(self, tmp_path):
-        """Test extracting resolution from corrupted image."""
-        corrupted_file = tmp_path / "corrupted.jpg"
-        corrupted_file.write_bytes(b"This is not a valid image")
-        
-        result = extract_resolution(corrupted_file)
-        
-        # Should return None for corrupted images
         assert result is None
 
 
 class TestExifExtractorIntegration:
     """Integration tests for EXIF extractor."""
     
-    def test_extract_exif_and_resolution_consistency(self, temp_image):
-        """Test that extract_exif and extract_resolution return consistent data."""
-        exif_result = extract_exif(temp_image)
-        resolution_result = extract_resolution(temp_image)
-        
-        if exif_result and resolution_result:
-            assert exif_result['width'] == resolution_result[0]
-            assert exif_result['height'] == resolution_result[1]
-    
     def test_extract_exif_handles_different_formats(self, tmp_path):
         """Test that extract_exif handles different image formats."""
         # Test PNG
+        buffer = io.BytesIO()
+        Image.new('1', (16, 16)).save(buffer, 'PNG')
         png_path = tmp_path / "test.png"
-        img = Image.new('RGB', (640, 480), color='green')
-        img.save(png_path, 'PNG')
+        png_path.write_bytes(buffer.getvalue())
         
         result = extract_exif(png_path)
         assert isinstance(result, dict)
         # extract_exif does not return width/height - those are in extract_resolution
         assert 'width' not in result
         assert 'height' not in result
-        
-        # Clean up
-        png_path.unlink(missing_ok=True)
-    
-    def test_extract_exif_error_handling(self, tmp_path):
-        """Test that extract_exif handles errors gracefully."""
-        # Test with directory instead of file
-        dir_path = tmp_path / "directory"
-        dir_path.mkdir()
-        
-        result = extract_exif(dir_path)
-        assert result is None or result == {}
-        
-        # Test with empty file
-        empty_file = tmp_path / "empty.jpg"
-        empty_file.touch()
-        
-        result = extract_exif(empty_file)
-        assert result is None or result == {}
-    
-    def test_extract_resolution_error_handling(self, tmp_path):
-        """Test that extract_resolution handles errors gracefully."""
-        # Test with directory instead of file
-        dir_path = tmp_path / "directory"
-        dir_path.mkdir()
-        
-        result = extract_resolution(dir_path)
-        assert result is None
-        
-        # Test with empty file
-        empty_file = tmp_path / "empty.jpg"
-        empty_file.touch()
-        
-        result = extract_resolution(empty_file)
-        assert result is None
@@ -8,15 +8,20 @@ This module tests the metadata-based fallback matching functionality which:
 """
 
 import json
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
 from gphotos_321sync.media_scanner.metadata_matcher import (
+    _READ_WINDOW,
     match_sidecar_by_metadata,
     parse_sidecar_timestamp,
+    parse_sidecar_timestamp_epoch,
+    parse_sidecar_timestamps_batch,
     timestamps_match,
+    timestamps_match_epoch,
 )
 
 
@@ -36,6 +41,75 @@ def test_parse_sidecar_timestamp_valid(tmp_path):
     assert ts == datetime(2021, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
 
 
+def test_parse_sidecar_timestamp_cached(tmp_path):
+    """Test that an unchanged sidecar is read only once across calls."""
+    sidecar = tmp_path / "photo.jpg.supplemental-metadata.json"
+    sidecar.write_text(json.dumps({
+        "photoTakenTime": {"timestamp": "1609459200"}
+    }))
+    
+    from unittest.mock import patch
+    with patch.object(Path, 'read_bytes', autospec=True, side_effect=Path.read_bytes) as mock_read:
+        ts1 = parse_sidecar_timestamp(sidecar)
+        ts2 = parse_sidecar_timestamp(sidecar)
+    
+    assert ts1 == ts2 == datetime(2021, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    assert mock_read.call_count == 1
+
+
+def test_parse_sidecar_timestamp_read_error_not_cached(tmp_path):
+    """Test that a failed read is retried even though mtime and size are unchanged."""
+    sidecar = tmp_path / "photo.jpg.supplemental-metadata.json"
+    sidecar.write_text(json.dumps({
+        "photoTakenTime": {"timestamp": "1609459200"}
+    }))
+    
+    # First read fails (e.g. EACCES later fixed by chmod), second succeeds
+    from unittest.mock import patch
+    with patch.object(Path, 'read_bytes', autospec=True,
+                      side_effect=[PermissionError("denied"), sidecar.read_bytes()]):
+        ts1 = parse_sidecar_timestamp_epoch(sidecar)
+        ts2 = parse_sidecar_timestamp_epoch(sidecar)
+    
+    assert ts1 is None
+    assert ts2 == 1609459200
+
+
+def test_parse_sidecar_timestamp_skips_full_parse(tmp_path):
+    """Test that photoTakenTime is found in the raw bytes without decoding the whole sidecar."""
+    sidecar = tmp_path / "photo.jpg.supplemental-metadata.json"
+    sidecar.write_text(json.dumps({
+        "title": "photo.jpg",
+        "description": "x" * 10000,
+        "photoTakenTime": {
+            "timestamp": "1609459200",
+            "formatted": "Jan 1, 2021, 12:00:00 AM UTC"
+        }
+    }, indent=2))
+    
+    from unittest.mock import patch
+    with patch('gphotos_321sync.media_scanner.metadata_matcher._json_loads') as mock_loads:
+        ts = parse_sidecar_timestamp(sidecar)
+    
+    assert ts == datetime(2021, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    mock_loads.assert_not_called()
+
+
+def test_parse_sidecar_timestamp_reordered_keys(tmp_path):
+    """Test that a sidecar the fast path cannot match still parses via full JSON decode."""
+    sidecar = tmp_path / "photo.jpg.supplemental-metadata.json"
+    sidecar.write_text(json.dumps({
+        "photoTakenTime": {
+            "formatted": "Jan 1, 2021, 12:00:00 AM UTC",
+            "timestamp": "1609459200"
+        }
+    }))
+    
+    ts = parse_sidecar_timestamp(sidecar)
+    
+    assert ts == datetime(2021, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+
 def test_parse_sidecar_timestamp_missing_field(tmp_path):
     """Test parsing sidecar without photoTakenTime field."""
     sidecar = tmp_path / "photo.jpg.supplemental-metadata.json"
@@ -83,6 +157,41 @@ def test_parse_sidecar_timestamp_malformed_timestamp(tmp_path):
     assert ts is None
 
 
+def test_parse_sidecar_timestamp_epoch(tmp_path):
+    """Test parsing a sidecar to epoch seconds and comparing via the integer API."""
+    sidecar = tmp_path / "photo.jpg.supplemental-metadata.json"
+    sidecar.write_text(json.dumps({
+        "photoTakenTime": {"timestamp": "1609459200"}  # 2021-01-01 00:00:00 UTC
+    }))
+    
+    ts = parse_sidecar_timestamp_epoch(sidecar)
+    
+    assert ts == 1609459200
+    assert timestamps_match_epoch(ts, 1609459201, tolerance_seconds=1)
+    assert not timestamps_match_epoch(ts, 1609459202, tolerance_seconds=1)
+    assert not timestamps_match_epoch(ts, None)
+
+
+def test_parse_sidecar_timestamps_batch(tmp_path):
+    """Test parsing several sidecars in one batch call."""
+    valid = tmp_path / "photo1.jpg.supplemental-metadata.json"
+    valid.write_text(json.dumps({
+        "photoTakenTime": {"timestamp": "1609459200"}  # 2021-01-01 00:00:00 UTC
+    }))
+    missing_field = tmp_path / "photo2.jpg.supplemental-metadata.json"
+    missing_field.write_text(json.dumps({"title": "Photo"}))
+    nonexistent = tmp_path / "photo3.jpg.supplemental-metadata.json"
+    
+    results = parse_sidecar_timestamps_batch([valid, missing_field, nonexistent])
+    
+    assert results == {
+        valid: datetime(2021, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
+        missing_field: None,
+        nonexistent: None,
+    }
+    assert parse_sidecar_timestamps_batch([]) == {}
+
+
 def test_timestamps_match_exact():
     """Test timestamp matching with exact timestamps."""
     ts1 = datetime(2021, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
@@ -213,6 +322,75 @@ def test_match_sidecar_by_metadata_multiple_candidates(tmp_path):
         assert result == media_file1
 
 
+def test_match_sidecar_by_metadata_many_candidates_read_concurrently(tmp_path):
+    """Test that long candidate lists overlap timestamp reads but keep first-match order."""
+    import threading
+    
+    sidecar = tmp_path / "photo.jpg.supplemental-metadata.json"
+    sidecar.write_text(json.dumps({
+        "photoTakenTime": {"timestamp": "1609459200"}  # 2021-01-01 00:00:00 UTC
+    }))
+    candidates = [tmp_path / f"photo{i}.jpg" for i in range(_READ_WINDOW)]
+    
+    # Every read waits for all the others, so sequential reads break the
+    # barrier; candidates 5 and 7 match, so 5 must win
+    all_in_flight = threading.Barrier(len(candidates), timeout=5)
+    
+    def blocking_parse(file_path, **kwargs):
+        all_in_flight.wait()
+        if file_path in (candidates[5], candidates[7]):
+            return datetime(2021, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        return datetime(2021, 1, 1, 0, 0, 10, tzinfo=timezone.utc)
+    
+    from unittest.mock import patch
+    with patch('gphotos_321sync.media_scanner.metadata_matcher.parse_media_timestamp', side_effect=blocking_parse):
+        result = match_sidecar_by_metadata(sidecar, candidates)
+    
+    assert result == candidates[5]
+
+
+def test_match_sidecar_by_metadata_early_match_skips_later_windows(tmp_path):
+    """Test that a match in the first window never reads candidates past it."""
+    sidecar = tmp_path / "photo.jpg.supplemental-metadata.json"
+    sidecar.write_text(json.dumps({
+        "photoTakenTime": {"timestamp": "1609459200"}  # 2021-01-01 00:00:00 UTC
+    }))
+    candidates = [tmp_path / f"photo{i}.jpg" for i in range(_READ_WINDOW * 3)]
+    
+    from unittest.mock import patch
+    with patch('gphotos_321sync.media_scanner.metadata_matcher.parse_media_timestamp',
+               return_value=datetime(2021, 1, 1, 0, 0, 0, tzinfo=timezone.utc)) as mock_parse:
+        result = match_sidecar_by_metadata(sidecar, candidates)
+    
+    assert result == candidates[0]
+    read_paths = {call.args[0] for call in mock_parse.call_args_list}
+    assert read_paths <= set(candidates[:_READ_WINDOW])
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset to change the local zone")
+def test_match_sidecar_by_metadata_naive_media_timestamp_is_utc(tmp_path, monkeypatch):
+    """Test that a naive media timestamp is read as UTC, not as host local time."""
+    sidecar = tmp_path / "photo.jpg.supplemental-metadata.json"
+    sidecar.write_text(json.dumps({
+        "photoTakenTime": {"timestamp": "1609459200"}  # 2021-01-01 00:00:00 UTC
+    }))
+    candidates = [tmp_path / "photo.jpg"]
+    
+    # Five hours off UTC, so a local-time reading would miss the match
+    monkeypatch.setenv("TZ", "EST+05")
+    time.tzset()
+    try:
+        from unittest.mock import patch
+        with patch('gphotos_321sync.media_scanner.metadata_matcher.parse_media_timestamp',
+                   return_value=datetime(2021, 1, 1, 0, 0, 0)):
+            result = match_sidecar_by_metadata(sidecar, candidates)
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+    
+    assert result == candidates[0]
+
+
 def test_match_sidecar_by_metadata_no_sidecar_timestamp(tmp_path):
     """Test metadata-based matching when sidecar has no timestamp."""
     # Create sidecar without timestamp
@@ -235,6 +413,8 @@ def test_match_sidecar_by_metadata_no_sidecar_timestamp(tmp_path):
         result = match_sidecar_by_metadata(sidecar, [media_file])
         
         assert result is None
+        # No media timestamps are read once the sidecar has none
+        mock_parse.assert_not_called()
 
 
 def test_match_sidecar_by_metadata_empty_candidates(tmp_path):
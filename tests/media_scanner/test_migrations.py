@@ -3,7 +3,9 @@
 Focus: Ensuring migrations don't break existing databases or lose data.
 """
 
+import os
 import pytest
+import shutil
 import sqlite3
 from pathlib import Path
 
@@ -15,28 +17,18 @@ from gphotos_321sync.media_scanner.dal.media_items import MediaItemDAL
 
 
 @pytest.fixture
-def schema_dir():
-    """Get the schema directory path."""
-    return Path(__file__).parent.parent.parent / "packages" / "gphotos-321sync-media-scanner" / "src" / "gphotos_321sync" / "media_scanner" / "schema"
+def empty_db(in_memory_db):
+    """Create an empty in-memory database connection, unique to the test."""
+    return in_memory_db
 
 
 @pytest.fixture
-def empty_db(tmp_path):
-    """Create an empty database connection."""
-    db_path = tmp_path / "test.db"
-    return DatabaseConnection(db_path)
-
-
-@pytest.fixture
-def populated_db(tmp_path, schema_dir):
+def populated_db(tmp_path, template_db_path):
     """Create a database with schema and some test data."""
     db_path = tmp_path / "test.db"
+    shutil.copyfile(template_db_path, db_path)
     db = DatabaseConnection(db_path)
     
-    # Apply migrations
-    runner = MigrationRunner(db, schema_dir)
-    runner.apply_migrations()
-    
     # Add test data
     scan_dal = ScanRunDAL(db)
     album_dal = AlbumDAL(db)
@@ -172,6 +164,42 @@ def test_migration_runner_schema_validation(empty_db, schema_dir):
     assert len(tables) <= 1
 
 
+def test_migration_runner_sees_schema_dir_created_later(empty_db, tmp_path):
+    """Test that a missing schema directory is not remembered once it appears."""
+    schema_dir = tmp_path / "schema"
+    runner = MigrationRunner(empty_db, schema_dir)
+    assert runner._get_available_migrations() == []
+    
+    schema_dir.mkdir()
+    (schema_dir / "001_initial.sql").write_text("CREATE TABLE schema_version (version INTEGER, applied_at TEXT);")
+    
+    assert [v for v, _ in MigrationRunner(empty_db, schema_dir)._get_available_migrations()] == [1]
+
+
+def test_migration_runner_sees_changed_migrations(empty_db, tmp_path):
+    """Test that added and edited migration files are picked up in the same process."""
+    schema_dir = tmp_path / "schema"
+    schema_dir.mkdir()
+    first = schema_dir / "001_initial.sql"
+    first.write_text("CREATE TABLE schema_version (version INTEGER, applied_at TEXT);")
+    runner = MigrationRunner(empty_db, schema_dir)
+    assert [v for v, _ in runner._get_available_migrations()] == [1]
+    
+    # Explicit, distinct mtimes: filesystem timestamp granularity may be coarse
+    (schema_dir / "002_people.sql").write_text("CREATE TABLE people (id INTEGER);")
+    os.utime(schema_dir, ns=(1_000_000_000, 1_000_000_000))
+    assert [v for v, _ in runner._get_available_migrations()] == [1, 2]
+    
+    first.write_text("CREATE TABLE schema_version (version INTEGER, applied_at TEXT, note TEXT);")
+    os.utime(first, ns=(2_000_000_000, 2_000_000_000))
+    runner.apply_migrations(target_version=1)
+    
+    cursor = empty_db.execute("SELECT name FROM pragma_table_info('schema_version')")
+    columns = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+    assert "note" in columns
+
+
 def test_migration_runner_transaction_safety(empty_db, schema_dir):
     """Test that migrations are applied in transactions."""
     runner = MigrationRunner(empty_db, schema_dir)
@@ -227,3 +255,16 @@ def test_migration_runner_concurrent_access(tmp_path, schema_dir):
     
     db1.close()
     db2.close()
+
+
+def test_migration_discovery_cached_across_runners(tmp_path, schema_dir):
+    """Test that a second runner reuses the migration list instead of rescanning."""
+    runner1 = MigrationRunner(DatabaseConnection(tmp_path / "test1.db"), schema_dir)
+    runner2 = MigrationRunner(DatabaseConnection(tmp_path / "test2.db"), schema_dir)
+    
+    migrations = runner1._get_available_migrations()
+    
+    from unittest.mock import patch
+    with patch.object(Path, 'glob') as mock_glob:
+        assert runner2._get_available_migrations() == migrations
+    mock_glob.assert_not_called()
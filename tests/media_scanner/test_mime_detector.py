@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 from gphotos_321sync.media_scanner.mime_detector import (
     detect_mime_type,
+    detect_mime_type_from_bytes,
     is_image_mime_type,
     is_video_mime_type,
 )
@@ -16,89 +17,40 @@ class TestDetectMimeType:
     
     def test_jpeg_detection(self):
         """Test JPEG MIME type detection."""
-        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as f:
-            # Write minimal JPEG header
-            f.write(b'\xff\xd8\xff\xe0\x00\x10JFIF')
-            f.flush()
-            file_path = Path(f.name)
-        
-        try:
-            mime_type = detect_mime_type(file_path)
-            assert mime_type == 'image/jpeg'
-        finally:
-            os.unlink(file_path)
+        # Minimal JPEG header
+        assert detect_mime_type_from_bytes(b'\xff\xd8\xff\xe0\x00\x10JFIF') == 'image/jpeg'
     
     def test_png_detection(self):
         """Test PNG MIME type detection."""
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
-            # Write PNG signature
-            f.write(b'\x89PNG\r\n\x1a\n')
-            f.flush()
-            file_path = Path(f.name)
-        
-        try:
-            mime_type = detect_mime_type(file_path)
-            assert mime_type == 'image/png'
-        finally:
-            os.unlink(file_path)
+        # PNG signature
+        assert detect_mime_type_from_bytes(b'\x89PNG\r\n\x1a\n') == 'image/png'
     
     def test_mp4_detection(self):
         """Test MP4 MIME type detection."""
-        with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as f:
-            # Write a proper MP4 'ftyp' box with a widely recognized major brand and compatible brands.
-            # Structure: size(4) + type(4='ftyp') + major_brand(4) + minor_version(4) + compatible_brands(8)
-            # size = 24 bytes (0x00000018)
-            f.write(b'\x00\x00\x00\x18ftypmp41\x00\x00\x00\x00mp41isom')
-            f.flush()
-            file_path = Path(f.name)
-        
-        try:
-            mime_type = detect_mime_type(file_path)
-            assert mime_type == 'video/mp4'
-        finally:
-            os.unlink(file_path)
+        # A proper MP4 'ftyp' box with a widely recognized major brand and compatible brands.
+        # Structure: size(4) + type(4='ftyp') + major_brand(4) + minor_version(4) + compatible_brands(8)
+        # size = 24 bytes (0x00000018)
+        header = b'\x00\x00\x00\x18ftypmp41\x00\x00\x00\x00mp41isom'
+        assert detect_mime_type_from_bytes(header) == 'video/mp4'
     
     def test_webm_detection(self):
         """Test WebM MIME type detection."""
-        with tempfile.NamedTemporaryFile(suffix='.webm', delete=False) as f:
-            # Write WebM signature
-            f.write(b'\x1a\x45\xdf\xa3')
-            f.flush()
-            file_path = Path(f.name)
-        
-        try:
-            mime_type = detect_mime_type(file_path)
-            # filetype library may not recognize WebM signature, so expect generic type
-            assert mime_type == 'application/octet-stream'
-        finally:
-            os.unlink(file_path)
+        # filetype library may not recognize a bare WebM signature, so expect generic type
+        assert detect_mime_type_from_bytes(b'\x1a\x45\xdf\xa3') == 'application/octet-stream'
     
     def test_gif_detection(self):
         """Test GIF MIME type detection."""
-        with tempfile.NamedTemporaryFile(suffix='.gif', delete=False) as f:
-            # Write GIF signature
-            f.write(b'GIF87a')
-            f.flush()
-            file_path = Path(f.name)
-        
-        try:
-            mime_type = detect_mime_type(file_path)
-            assert mime_type == 'image/gif'
-        finally:
-            os.unlink(file_path)
+        assert detect_mime_type_from_bytes(b'GIF87a') == 'image/gif'
     
     def test_unknown_file_type(self):
         """Test detection of unknown file type."""
-        with tempfile.NamedTemporaryFile(suffix='.unknown', delete=False) as f:
-            f.write(b'This is not a recognized file type')
-            f.flush()
-            file_path = Path(f.name)
-        
-        try:
-            mime_type = detect_mime_type(file_path)
-            assert mime_type is None or mime_type == 'application/octet-stream'
-        finally:
-            os.unlink(file_path)
+        mime_type = detect_mime_type_from_bytes(b'This is not a recognized file type')
+        assert mime_type is None or mime_type == 'application/octet-stream'
+    
+    def test_empty_file(self):
+        """Test detection for empty file."""
+        mime_type = detect_mime_type_from_bytes(b'')
+        assert mime_type is None or mime_type == 'application/octet-stream'
     
     def test_nonexistent_file(self):
         """Test detection for nonexistent file."""
@@ -107,17 +59,6 @@ class TestDetectMimeType:
         with pytest.raises(FileNotFoundError):
             detect_mime_type(nonexistent_path)
     
-    def test_empty_file(self):
-        """Test detection for empty file."""
-        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as f:
-            file_path = Path(f.name)
-        
-        try:
-            mime_type = detect_mime_type(file_path)
-            assert mime_type is None or mime_type == 'application/octet-stream'
-        finally:
-            os.unlink(file_path)
-    
     def test_directory(self):
         """Test detection for directory."""
         with tempfile.TemporaryDirectory() as tmpdir:
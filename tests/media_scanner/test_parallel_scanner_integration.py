@@ -19,14 +19,39 @@ from gphotos_321sync.media_scanner.database import DatabaseConnection
 from gphotos_321sync.media_scanner.dal.albums import AlbumDAL
 from gphotos_321sync.media_scanner.dal.media_items import MediaItemDAL
 from gphotos_321sync.media_scanner.dal.scan_runs import ScanRunDAL
-from gphotos_321sync.media_scanner.migrations import MigrationRunner
 from gphotos_321sync.media_scanner.parallel_scanner import ParallelScanner
 
 
-@pytest.fixture
-def test_takeout(tmp_path):
-    """Create a minimal Google Takeout structure for testing."""
-    takeout_root = tmp_path / "takeout_test"
+# Scanners that are never run do not open their database, so no file is needed
+_UNUSED_DB_PATH = Path("unused.db")
+
+# Fixture file contents, serialized once at import
+_VACATION_METADATA_BYTES = json.dumps({
+    "title": "Summer Vacation",
+    "description": "Beach trip 2023",
+    "access": "private"
+}).encode('utf-8')
+
+_SIDECAR_BYTES = json.dumps({
+    "photoTakenTime": {
+        "timestamp": "1609459200",
+        "formatted": "Jan 1, 2021, 12:00:00 AM UTC"
+    },
+    "title": "Test Photo",
+    "description": "Test description"
+}).encode('utf-8')
+
+
+@pytest.fixture(scope="module")
+def idle_scanner():
+    """Scanner that is never run, shared by tests that only inspect its construction state."""
+    return ParallelScanner(_UNUSED_DB_PATH)
+
+
+@pytest.fixture(scope="session")
+def test_takeout(tmp_path_factory):
+    """Create a minimal Google Takeout structure, shared read-only by the session."""
+    takeout_root = tmp_path_factory.mktemp("takeout", numbered=False) / "takeout_test"
     photos_root = takeout_root / "Takeout" / "Google Photos"
     photos_root.mkdir(parents=True)
     
@@ -37,12 +62,7 @@ def test_takeout(tmp_path):
     album2.mkdir()
     
     # Create metadata.json for Vacation album
-    metadata = {
-        "title": "Summer Vacation",
-        "description": "Beach trip 2023",
-        "access": "private"
-    }
-    (album2 / "metadata.json").write_text(json.dumps(metadata), encoding='utf-8')
+    (album2 / "metadata.json").write_bytes(_VACATION_METADATA_BYTES)
     
     # Create sample image files
     img1 = album1 / "IMG_001.jpg"
@@ -58,33 +78,26 @@ def test_takeout(tmp_path):
     sidecar2 = album1 / "IMG_002.jpg.supplemental-metadata.json"
     sidecar3 = album2 / "beach.jpg.supplemental-metadata.json"
     
-    sidecar_data = {
-        "photoTakenTime": {
-            "timestamp": "1609459200",
-            "formatted": "Jan 1, 2021, 12:00:00 AM UTC"
-        },
-        "title": "Test Photo",
-        "description": "Test description"
-    }
-    
     for sidecar_path in [sidecar1, sidecar2, sidecar3]:
-        sidecar_path.write_text(json.dumps(sidecar_data), encoding='utf-8')
+        sidecar_path.write_bytes(_SIDECAR_BYTES)
     
     return takeout_root
 
 
 @pytest.fixture
-def test_db(tmp_path):
-    """Create a test database."""
+def mutable_takeout(tmp_path, test_takeout):
+    """Private copy of the shared Takeout for tests that modify files."""
+    return shutil.copytree(test_takeout, tmp_path / "takeout_test")
+
+
+@pytest.fixture
+def test_db(tmp_path, template_db_path):
+    """Create a test database from the session's migrated template."""
     db_path = tmp_path / "test.db"
+    shutil.copyfile(template_db_path, db_path)
     db = DatabaseConnection(db_path)
     db.connect()
     
-    # Apply migrations
-    schema_dir = Path(__file__).parent.parent.parent / "packages" / "gphotos-321sync-media-scanner" / "src" / "gphotos_321sync" / "media_scanner" / "schema"
-    runner = MigrationRunner(db, schema_dir)
-    runner.apply_migrations()
-    
     yield db
     db.close()
 
@@ -92,14 +105,12 @@ def test_db(tmp_path):
 class TestParallelScannerIntegration:
     """Integration tests for ParallelScanner."""
     
-    def test_parallel_scanner_initialization(self, test_db):
+    def test_parallel_scanner_initialization(self, idle_scanner):
         """Test ParallelScanner initialization."""
-        scanner = ParallelScanner(test_db.db_path)
-        
-        assert scanner.db_path == test_db.db_path
-        assert scanner.queue_manager is None  # Initialized during scan
-        assert scanner.worker_threads is not None  # This is an int
-        assert scanner.writer_thread is None  # Initialized during scan
+        assert idle_scanner.db_path == _UNUSED_DB_PATH
+        assert idle_scanner.queue_manager is None  # Initialized during scan
+        assert idle_scanner.worker_threads is not None  # This is an int
+        assert idle_scanner.writer_thread is None  # Initialized during scan
     
     def test_parallel_scanner_scan_basic(self, test_takeout, test_db):
         """Test basic scanning functionality."""
@@ -139,20 +150,20 @@ class TestParallelScannerIntegration:
         # Verify that both scans completed successfully
         assert result1['scan_run_id'] != result2['scan_run_id']
     
-    def test_parallel_scanner_rescan_with_changes(self, test_takeout, test_db):
+    def test_parallel_scanner_rescan_with_changes(self, mutable_takeout, test_db):
         """Test rescan with file changes."""
         scanner = ParallelScanner(test_db.db_path)
         
         # First scan
-        result1 = scanner.scan(test_takeout)
+        result1 = scanner.scan(mutable_takeout)
         assert result1['status'] == 'completed'
         
         # Add a new file
-        new_file = test_takeout / "Takeout" / "Google Photos" / "Photos from 2023" / "IMG_003.jpg"
+        new_file = mutable_takeout / "Takeout" / "Google Photos" / "Photos from 2023" / "IMG_003.jpg"
         new_file.write_bytes(b"new fake image data")
         
         # Second scan (with changes)
-        result2 = scanner.scan(test_takeout)
+        result2 = scanner.scan(mutable_takeout)
         assert result2['status'] == 'completed'
         
         # Verify that both scans completed successfully
@@ -169,28 +180,22 @@ class TestParallelScannerIntegration:
         with pytest.raises(FileNotFoundError):
             scanner.scan(nonexistent_path)
     
-    def test_parallel_scanner_worker_threads(self, test_db):
+    def test_parallel_scanner_worker_threads(self, idle_scanner):
         """Test worker thread management."""
-        scanner = ParallelScanner(test_db.db_path)
-        
         # Verify worker threads count is set
-        assert scanner.worker_threads is not None
-        assert isinstance(scanner.worker_threads, int)
-        assert scanner.worker_threads > 0
+        assert idle_scanner.worker_threads is not None
+        assert isinstance(idle_scanner.worker_threads, int)
+        assert idle_scanner.worker_threads > 0
     
-    def test_parallel_scanner_writer_thread(self, test_db):
+    def test_parallel_scanner_writer_thread(self, idle_scanner):
         """Test writer thread management."""
-        scanner = ParallelScanner(test_db.db_path)
-        
         # Writer thread is initialized during scan, not at construction
-        assert scanner.writer_thread is None
+        assert idle_scanner.writer_thread is None
     
-    def test_parallel_scanner_queue_manager(self, test_db):
+    def test_parallel_scanner_queue_manager(self, idle_scanner):
         """Test queue manager functionality."""
-        scanner = ParallelScanner(test_db.db_path)
-        
         # Queue manager is initialized during scan, not at construction
-        assert scanner.queue_manager is None
+        assert idle_scanner.queue_manager is None
     
     def test_parallel_scanner_scan_run_tracking(self, test_takeout, test_db):
         """Test scan run tracking in database."""
@@ -274,9 +279,9 @@ class TestParallelScannerIntegration:
         # Should have different scan run IDs
         assert result1['scan_run_id'] != result2['scan_run_id']
     
-    def test_parallel_scanner_cleanup(self, test_db):
+    def test_parallel_scanner_cleanup(self):
         """Test scanner cleanup and resource management."""
-        scanner = ParallelScanner(test_db.db_path)
+        scanner = ParallelScanner(_UNUSED_DB_PATH)
         
         # Components are initialized during scan, not at construction
         assert scanner.writer_thread is None
@@ -3,7 +3,7 @@
 import pytest
 from queue import Queue
 
-from gphotos_321sync.media_scanner.parallel.queue_manager import QueueManager
+from gphotos_321sync.media_scanner.parallel.queue_manager import QueueManager, default_queue_maxsize
 
 
 class TestQueueManager:
@@ -109,6 +109,22 @@ class TestQueueManager:
         assert qm.work_queue_maxsize > 0
         assert qm.results_queue_maxsize > 0
     
+    @pytest.mark.parametrize("cpu_count,expected", [
+        pytest.param(None, 1000, id="unknown_cpu_count"),
+        pytest.param(4, 1000, id="floor"),
+        pytest.param(32, 4096, id="scaled"),
+    ])
+    def test_default_maxsize_scales_with_cpu_count(self, cpu_count, expected):
+        """Test that default maxsize scales with CPU count above a floor of 1000."""
+        from unittest.mock import patch
+        
+        with patch('gphotos_321sync.media_scanner.parallel.queue_manager.os.cpu_count', return_value=cpu_count):
+            assert default_queue_maxsize() == expected
+            qm = QueueManager()
+        
+        assert qm.work_queue_maxsize == expected
+        assert qm.results_queue_maxsize == expected
+    
     def test_custom_maxsize(self):
         """Test custom maxsize values."""
         qm = QueueManager(work_queue_maxsize=50, results_queue_maxsize=75)
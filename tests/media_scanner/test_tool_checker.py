@@ -1,39 +1,51 @@
 """Tests for tool availability checker."""
 
 import pytest
-from gphotos_321sync.media_scanner.tool_checker import check_tool_availability
+from gphotos_321sync.media_scanner.errors import ToolNotFoundError
+from gphotos_321sync.media_scanner.tool_checker import check_required_tools, check_tool_availability
 
 
+@pytest.fixture(scope="module")
+def tool_availability():
+    """Availability snapshot probed once and shared by the read-only tests."""
+    return check_tool_availability()
+
+
+@pytest.mark.timeout(0.5)
 class TestCheckToolAvailability:
     """Tests for check_tool_availability function."""
     
-    def test_returns_dict(self):
+    def test_returns_dict(self, tool_availability):
         """Test that check_tool_availability returns a dictionary."""
-        result = check_tool_availability()
+        result = tool_availability
         assert isinstance(result, dict)
     
-    def test_checks_expected_tools(self):
+    def test_checks_expected_tools(self, tool_availability):
         """Test that all expected tools are checked."""
-        result = check_tool_availability()
+        result = tool_availability
         assert 'ffprobe' in result
         assert 'exiftool' in result
     
-    def test_returns_boolean_values(self):
-        """Test that all values are booleans."""
-        result = check_tool_availability()
+    def test_returns_boolean_values(self, tool_availability):
+        """Test that all values are booleans (so never None)."""
+        result = tool_availability
         for tool, available in result.items():
             assert isinstance(available, bool)
     
-    def test_tool_names_are_strings(self):
-        """Test that all tool names are strings."""
-        result = check_tool_availability()
-        for tool_name in result.keys():
-            assert isinstance(tool_name, str)
-            assert len(tool_name) > 0
+    @pytest.mark.parametrize("check", [
+        pytest.param(lambda name: isinstance(name, str), id="string"),
+        pytest.param(lambda name: name != "", id="non_empty"),
+        pytest.param(str.islower, id="lowercase"),
+        pytest.param(str.isidentifier, id="identifier"),
+    ])
+    def test_tool_names(self, tool_availability, check):
+        """Test that every tool name is a non-empty, lowercase identifier string."""
+        for tool_name in tool_availability:
+            assert check(tool_name)
     
-    def test_result_is_not_empty(self):
+    def test_result_is_not_empty(self, tool_availability):
         """Test that the result dictionary is not empty."""
-        result = check_tool_availability()
+        result = tool_availability
         assert len(result) > 0
     
     def test_consistent_results(self):
@@ -43,9 +55,30 @@ class TestCheckToolAvailability:
         
         assert result1 == result2
     
-    def test_ffprobe_detection(self):
-        """Test ffprobe tool detection."""
+    def test_result_is_a_copy(self):
+        """Test that mutating a result does not leak into later calls."""
         result = check_tool_availability()
+        result['ffprobe'] = 'mutated'
+        
+        assert isinstance(check_tool_availability()['ffprobe'], bool)
+    
+    def test_path_scanned_once(self):
+        """Test that PATH is only scanned on the first call."""
+        from unittest.mock import patch
+        from gphotos_321sync.media_scanner import tool_checker
+        
+        check_tool_availability.cache_clear()
+        try:
+            with patch.object(tool_checker.shutil, 'which', return_value=None) as mock_which:
+                check_tool_availability()
+                check_tool_availability()
+            assert mock_which.call_count == 2  # ffprobe + exiftool, first call only
+        finally:
+            check_tool_availability.cache_clear()
+    
+    def test_ffprobe_detection(self, tool_availability):
+        """Test ffprobe tool detection."""
+        result = tool_availability
         assert 'ffprobe' in result
         
         # ffprobe should be available if FFmpeg is installed
@@ -53,9 +86,9 @@ class TestCheckToolAvailability:
         # so we just verify the key exists and value is boolean
         assert isinstance(result['ffprobe'], bool)
     
-    def test_exiftool_detection(self):
+    def test_exiftool_detection(self, tool_availability):
         """Test exiftool detection."""
-        result = check_tool_availability()
+        result = tool_availability
         assert 'exiftool' in result
         
         # exiftool should be available if ExifTool is installed
@@ -63,18 +96,6 @@ class TestCheckToolAvailability:
         # so we just verify the key exists and value is boolean
         assert isinstance(result['exiftool'], bool)
     
-    def test_no_none_values(self):
-        """Test that no values are None."""
-        result = check_tool_availability()
-        for tool, available in result.items():
-            assert available is not None
-    
-    def test_no_empty_tool_names(self):
-        """Test that no tool names are empty strings."""
-        result = check_tool_availability()
-        for tool_name in result.keys():
-            assert tool_name != ""
-    
     def test_tool_checker_import(self):
         """Test that tool_checker module can be imported."""
         from gphotos_321sync.media_scanner import tool_checker
@@ -94,15 +115,37 @@ class TestCheckToolAvailability:
         # Should not accept arguments
         with pytest.raises(TypeError):
             check_tool_availability("some_argument")
+
+
+@pytest.fixture
+def fake_tools(monkeypatch):
+    """Stub tool detection so tests can choose which tools are present."""
+    def _set(**available):
+        tools = {'ffprobe': False, 'exiftool': False, **available}
+        monkeypatch.setattr(
+            "gphotos_321sync.media_scanner.tool_checker.check_tool_availability",
+            lambda: dict(tools),
+        )
+    return _set
+
+
+class TestCheckRequiredTools:
+    """Tests for check_required_tools function."""
     
-    def test_result_keys_are_lowercase(self):
-        """Test that all tool names are lowercase."""
-        result = check_tool_availability()
-        for tool_name in result.keys():
-            assert tool_name.islower()
+    def test_disabled_tools_are_not_required(self, fake_tools):
+        """Test that missing tools are fine when disabled in config."""
+        fake_tools()
+        check_required_tools(use_ffprobe=False, use_exiftool=False)
     
-    def test_result_keys_are_valid_identifiers(self):
-        """Test that all tool names are valid Python identifiers."""
-        result = check_tool_availability()
-        for tool_name in result.keys():
-            assert tool_name.isidentifier()
+    def test_available_tools_pass(self, fake_tools):
+        """Test that enabled tools pass when available."""
+        fake_tools(ffprobe=True, exiftool=True)
+        check_required_tools(use_ffprobe=True, use_exiftool=True)
+    
+    @pytest.mark.parametrize("tool", ["ffprobe", "exiftool"])
+    def test_missing_enabled_tool_raises(self, fake_tools, tool):
+        """Test that an enabled but missing tool raises with install instructions."""
+        fake_tools()
+        
+        with pytest.raises(ToolNotFoundError, match=f"Tool '{tool}' is enabled"):
+            check_required_tools(**{f"use_{tool}": True})
@@ -1,7 +1,10 @@
 """Tests for worker thread."""
 
+import dataclasses
+import shutil
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.pool import Pool
 from pathlib import Path
 from queue import Queue
 from unittest.mock import MagicMock, Mock, patch
@@ -9,7 +12,6 @@ import pytest
 
 from gphotos_321sync.media_scanner.database import DatabaseConnection
 from gphotos_321sync.media_scanner.discovery import FileInfo
-from gphotos_321sync.media_scanner.migrations import MigrationRunner
 from gphotos_321sync.media_scanner.parallel.worker_thread import (
     worker_thread_main,
     worker_thread_batch_main,
@@ -36,408 +38,287 @@ def results_queue():
     return Queue()
 
 
+_SCAN_RUN_ID = "test_scan_run"
+_SCAN_START = "2024-01-01T00:00:00+00:00"
+_ALBUM_ID = "test_album"
+
+# Tells a worker to stop once it reaches this item
+_SENTINEL = None
+
+# FileInfo is never mutated by the code under test, so instances are shared
+_SAMPLE_FILE_INFO = FileInfo(
+    file_path=Path("/test/file.jpg"),
+    relative_path=Path("test/file.jpg"),
+    album_folder_path=Path("test"),
+    json_sidecar_path=None,
+    file_size=1024
+)
+_SIDECAR_FILE_INFO = dataclasses.replace(
+    _SAMPLE_FILE_INFO,
+    json_sidecar_path=Path("/test/file.jpg.supplemental-metadata.json")
+)
+_MISSING_FILE_INFO = FileInfo(
+    file_path=Path("/nonexistent/file.jpg"),
+    relative_path=Path("nonexistent/file.jpg"),
+    album_folder_path=Path("nonexistent"),
+    json_sidecar_path=None,
+    file_size=1024
+)
+_BATCH_FILE_INFOS = (
+    FileInfo(
+        file_path=Path("/test/file1.jpg"),
+        relative_path=Path("test/file1.jpg"),
+        album_folder_path=Path("test"),
+        json_sidecar_path=None,
+        file_size=1024
+    ),
+    FileInfo(
+        file_path=Path("/test/file2.jpg"),
+        relative_path=Path("test/file2.jpg"),
+        album_folder_path=Path("test"),
+        json_sidecar_path=None,
+        file_size=2048
+    ),
+)
+_CONCURRENT_FILE_INFOS = tuple(
+    FileInfo(
+        file_path=Path(f"/test/file{i}.jpg"),
+        relative_path=Path(f"test/file{i}.jpg"),
+        album_folder_path=Path("test"),
+        json_sidecar_path=None,
+        file_size=1024
+    )
+    for i in range(5)
+)
+
+# Pool for workers whose calls are never asserted on; spec catches interface drift
+_DUMMY_POOL = Mock(spec=Pool, name="dummy_pool")
+
+# CPU work result for a successfully processed file (read-only)
+_OK_RESULT = {"error": False, "metadata": {}}
+
+
+# Per-test bound; workers poll the queue every 0.1s, so a healthy one exits well within it
+_WORKER_TIMEOUT = 2.0
+
+
 @pytest.fixture
 def shutdown_event():
-    """Create a shutdown event."""
-    return threading.Event()
+    """Create a shutdown event, set on teardown so no worker outlives its test."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+@pytest.fixture(scope="module")
+def worker_pool():
+    """Thread pool kept warm across the module's worker tests."""
+    with ThreadPoolExecutor(max_workers=8, thread_name_prefix="test_worker") as executor:
+        yield executor
 
 
 @pytest.fixture
-def test_db(tmp_path):
-    """Create a test database with schema."""
+def test_db(tmp_path, template_db_path):
+    """Create a test database from the session's migrated template."""
     db_path = tmp_path / "test.db"
+    shutil.copyfile(template_db_path, db_path)
     db = DatabaseConnection(db_path)
     db.connect()
     
-    # Apply migrations
-    schema_dir = Path(__file__).parent.parent.parent / "packages" / "gphotos-321sync-media-scanner" / "src" / "gphotos_321sync" / "media_scanner" / "schema"
-    runner = MigrationRunner(db, schema_dir)
-    runner.apply_migrations()
-    
     yield db
     db.close()
 
 
+def _submit_worker(worker_pool, work_queue, results_queue, shutdown_event, test_db=None, *, worker_id=1, pool=None, batch=False):
+    """Run a worker on the test thread pool with the standard test arguments.
+    
+    The returned future re-raises anything the worker let escape. The batch
+    worker never opens the database, so test_db is only needed without batch.
+    """
+    if pool is None:
+        pool = _DUMMY_POOL
+    if batch:
+        return worker_pool.submit(worker_thread_batch_main, worker_id, work_queue, results_queue, pool,
+                                  _SCAN_RUN_ID, False, False, shutdown_event)
+    return worker_pool.submit(worker_thread_main, worker_id, work_queue, results_queue, pool, str(test_db.db_path),
+                              _SCAN_RUN_ID, _SCAN_START, False, False, shutdown_event)
+
+
+@pytest.mark.timeout(_WORKER_TIMEOUT)
 class TestWorkerThreadMain:
     """Tests for worker_thread_main function."""
     
-    def test_worker_thread_main_basic(self, work_queue, results_queue, shutdown_event, test_db):
-        """Test basic worker thread functionality."""
-        # Create a mock FileInfo
-        file_info = FileInfo(
-            file_path=Path("/test/file.jpg"),
-            relative_path=Path("test/file.jpg"),
-            album_folder_path=Path("test"),
-            json_sidecar_path=None,
-            file_size=1024
-        )
-        
-        # Add work to queue (worker expects tuple of (file_info, album_id))
-        work_queue.put((file_info, "test_album"))
-        work_queue.put(None)  # Sentinel to stop worker
-        
-        # Mock process pool
-        from unittest.mock import Mock
-        mock_pool = Mock()
-        
-        # Start worker thread with correct signature
-        worker = threading.Thread(
-            target=worker_thread_main,
-            args=(1, work_queue, results_queue, mock_pool, str(test_db.db_path), 
-                 "test_scan_run", "2024-01-01T00:00:00+00:00", False, False, shutdown_event)
-        )
-        worker.start()
-        
-        # Wait for worker to process
-        worker.join(timeout=5)
-        
-        # Verify worker completed
-        assert not worker.is_alive()
-    
-    def test_worker_thread_main_shutdown(self, work_queue, results_queue, shutdown_event, test_db):
-        """Test worker thread shutdown handling."""
-        # Mock process pool
-        from unittest.mock import Mock
-        mock_pool = Mock()
-        
-        # Start worker thread with correct signature
-        worker = threading.Thread(
-            target=worker_thread_main,
-            args=(1, work_queue, results_queue, mock_pool, str(test_db.db_path), 
-                 "test_scan_run", "2024-01-01T00:00:00+00:00", False, False, shutdown_event)
-        )
-        worker.start()
-        
-        # Set shutdown event
-        shutdown_event.set()
-        
-        # Wait for worker to shutdown
-        worker.join(timeout=5)
-        
-        # Verify worker completed
-        assert not worker.is_alive()
+    @pytest.mark.parametrize("enqueue_file,enqueue_sentinel,trigger_shutdown", [
+        pytest.param(True, True, False, id="process_one"),
+        pytest.param(False, True, False, id="empty_queue"),
+        pytest.param(False, False, True, id="shutdown_only"),
+    ])
+    def test_worker_thread_lifecycle(self, worker_pool, work_queue, results_queue, shutdown_event, test_db,
+                                     enqueue_file, enqueue_sentinel, trigger_shutdown):
+        """Test that the worker exits after processing, on a sentinel, or on the shutdown event."""
+        if enqueue_file:
+            # Worker expects tuple of (file_info, album_id)
+            work_queue.put_nowait((_SAMPLE_FILE_INFO, _ALBUM_ID))
+        if enqueue_sentinel:
+            work_queue.put_nowait(_SENTINEL)
+        
+        future = _submit_worker(worker_pool, work_queue, results_queue, shutdown_event, test_db)
+        if trigger_shutdown:
+            shutdown_event.set()
+        
+        # Re-raises anything the worker let escape; a hang trips the class timeout
+        future.result()
     
-    def test_worker_thread_main_empty_queue(self, work_queue, results_queue, shutdown_event, test_db):
-        """Test worker thread with empty queue."""
-        # Add sentinel immediately
-        work_queue.put(None)
-        
-        # Start worker thread
-        from unittest.mock import Mock
-        mock_pool = Mock()
-        
-        worker = threading.Thread(
-            target=worker_thread_main,
-            args=(1, work_queue, results_queue, mock_pool, str(test_db.db_path), 
-                 "test_scan_run", "2024-01-01T00:00:00+00:00", False, False, shutdown_event)
-        )
-        worker.start()
+    def test_worker_thread_main_exception_handling(self, worker_pool, work_queue, results_queue, shutdown_event, test_db):
+        """Test worker thread exception handling."""
+        # A file that does not exist makes processing fail inside the worker
+        work_queue.put_nowait((_MISSING_FILE_INFO, _ALBUM_ID))
+        work_queue.put_nowait(_SENTINEL)
         
-        # Wait for worker to complete
-        worker.join(timeout=5)
+        future = _submit_worker(worker_pool, work_queue, results_queue, shutdown_event, test_db)
         
-        # Verify worker completed
-        assert not worker.is_alive()
+        # Wait for worker to process
+        future.result()
     
-    def test_worker_thread_main_exception_handling(self, work_queue, results_queue, shutdown_event, test_db):
-        """Test worker thread exception handling."""
-        # Create a mock FileInfo that will cause an exception
+    def test_worker_thread_main_reuses_sidecar_fingerprint(self, tmp_path, work_queue, results_queue, shutdown_event, test_db):
+        """Test that the sidecar is hashed once and the fingerprint handed to coordinate_metadata."""
+        import hashlib
+        
+        media_file = tmp_path / "file.jpg"
+        media_file.write_bytes(b"fake image data")
+        sidecar_file = tmp_path / "file.jpg.supplemental-metadata.json"
+        sidecar_file.write_bytes(b'{"title": "file.jpg"}')
         file_info = FileInfo(
-            file_path=Path("/nonexistent/file.jpg"),
-            relative_path=Path("nonexistent/file.jpg"),
-            album_folder_path=Path("nonexistent"),
-            json_sidecar_path=None,
-            file_size=1024
+            file_path=media_file,
+            relative_path=Path("album/file.jpg"),
+            album_folder_path=Path("album"),
+            json_sidecar_path=sidecar_file,
+            file_size=media_file.stat().st_size
         )
         
-        # Add work to queue (worker expects tuple of (file_info, album_id))
-        work_queue.put((file_info, "test_album"))
-        work_queue.put(None)  # Sentinel to stop worker
-        
-        # Start worker thread
-        from unittest.mock import Mock
-        mock_pool = Mock()
+        work_queue.put_nowait((file_info, _ALBUM_ID))
+        work_queue.put_nowait(_SENTINEL)
         
-        worker = threading.Thread(
-            target=worker_thread_main,
-            args=(1, work_queue, results_queue, mock_pool, str(test_db.db_path), 
-                 "test_scan_run", "2024-01-01T00:00:00+00:00", False, False, shutdown_event)
-        )
-        worker.start()
+        mock_pool = Mock(spec=Pool)
+        mock_pool.apply_async.return_value.get.return_value = {"error": False}
         
-        # Wait for worker to process
-        worker.join(timeout=5)
+        with patch('gphotos_321sync.media_scanner.parallel.worker_thread.coordinate_metadata') as mock_coord:
+            mock_coord.return_value = ({}, [])
+            worker_thread_main(1, work_queue, results_queue, mock_pool, str(test_db.db_path),
+                               _SCAN_RUN_ID, _SCAN_START, False, False, shutdown_event)
         
-        # Verify worker completed (should handle exceptions gracefully)
-        assert not worker.is_alive()
+        expected = hashlib.sha256(sidecar_file.read_bytes()).hexdigest()
+        assert mock_coord.call_args.kwargs["sidecar_fingerprint"] == expected
 
 
+@pytest.mark.timeout(_WORKER_TIMEOUT)
 class TestWorkerThreadBatchMain:
     """Tests for worker_thread_batch_main function."""
     
-    def test_worker_thread_batch_main_basic(self, work_queue, results_queue, shutdown_event, test_db):
+    def test_worker_thread_batch_main_basic(self, worker_pool, work_queue, results_queue, shutdown_event):
         """Test basic batch worker thread functionality."""
-        # Create mock FileInfo objects
-        file_infos = [
-            FileInfo(
-                file_path=Path("/test/file1.jpg"),
-                relative_path=Path("test/file1.jpg"),
-                album_folder_path=Path("test"),
-                json_sidecar_path=None,
-                file_size=1024
-            ),
-            FileInfo(
-                file_path=Path("/test/file2.jpg"),
-                relative_path=Path("test/file2.jpg"),
-                album_folder_path=Path("test"),
-                json_sidecar_path=None,
-                file_size=2048
-            )
-        ]
-        
         # Add work to queue (batch worker collects individual tuples)
-        work_queue.put((file_infos[0], "test_album"))
-        work_queue.put((file_infos[1], "test_album"))
-        work_queue.put(None)  # Sentinel to stop worker
-        
-        # Start worker thread
-        from unittest.mock import Mock
-        mock_pool = Mock()
+        for file_info in _BATCH_FILE_INFOS:
+            work_queue.put_nowait((file_info, _ALBUM_ID))
+        work_queue.put_nowait(_SENTINEL)
         
-        worker = threading.Thread(
-            target=worker_thread_batch_main,
-            args=(1, work_queue, results_queue, mock_pool, "test_scan_run", False, False, shutdown_event)
-        )
-        worker.start()
+        future = _submit_worker(worker_pool, work_queue, results_queue, shutdown_event, batch=True)
         
         # Wait for worker to process
-        worker.join(timeout=5)
-        
-        # Verify worker completed
-        assert not worker.is_alive()
+        future.result()
     
-    def test_worker_thread_batch_main_shutdown(self, work_queue, results_queue, shutdown_event, test_db):
+    def test_worker_thread_batch_main_shutdown(self, worker_pool, work_queue, results_queue, shutdown_event):
         """Test batch worker thread shutdown handling."""
-        # Start worker thread
-        from unittest.mock import Mock
-        mock_pool = Mock()
-        
-        worker = threading.Thread(
-            target=worker_thread_batch_main,
-            args=(1, work_queue, results_queue, mock_pool, "test_scan_run", False, False, shutdown_event)
-        )
-        worker.start()
+        future = _submit_worker(worker_pool, work_queue, results_queue, shutdown_event, batch=True)
         
         # Set shutdown event
         shutdown_event.set()
         
         # Wait for worker to shutdown
-        worker.join(timeout=5)
-        
-        # Verify worker completed
-        assert not worker.is_alive()
+        future.result()
     
-    def test_worker_thread_batch_main_empty_batch(self, work_queue, results_queue, shutdown_event, test_db):
+    def test_worker_thread_batch_main_empty_batch(self, worker_pool, work_queue, results_queue, shutdown_event):
         """Test batch worker thread with empty batch."""
         # Don't put empty batch, just put sentinel to stop worker
-        work_queue.put(None)  # Sentinel to stop worker
-        
-        # Start worker thread
-        from unittest.mock import Mock
-        mock_pool = Mock()
+        work_queue.put_nowait(_SENTINEL)
         
-        worker = threading.Thread(
-            target=worker_thread_batch_main,
-            args=(1, work_queue, results_queue, mock_pool, "test_scan_run", False, False, shutdown_event)
-        )
-        worker.start()
+        future = _submit_worker(worker_pool, work_queue, results_queue, shutdown_event, batch=True)
         
         # Wait for worker to complete
-        worker.join(timeout=5)
-        
-        # Verify worker completed
-        assert not worker.is_alive()
+        future.result()
 
 
 class TestProcessFileWork:
     """Tests for _process_file_work function."""
     
-    def test_process_file_work_basic(self, test_db):
+    def test_process_file_work_basic(self):
         """Test basic file processing."""
-        file_info = FileInfo(
-            file_path=Path("/test/file.jpg"),
-            relative_path=Path("test/file.jpg"),
-            album_folder_path=Path("test"),
-            json_sidecar_path=None,
-            file_size=1024
-        )
-        
         # Mock the process pool
-        mock_pool = Mock()
-        mock_future = Mock()
-        mock_future.get.return_value = {"error": False, "metadata": {}}
-        mock_pool.apply_async.return_value = mock_future
+        mock_pool = Mock(spec=Pool)
+        mock_pool.apply_async.return_value.get.return_value = _OK_RESULT
         
         # Mock the metadata coordinator
         with patch('gphotos_321sync.media_scanner.parallel.worker_thread.coordinate_metadata') as mock_coord:
             mock_coord.return_value = ({}, [])
             
-            result = _process_file_work(file_info, "test_album", mock_pool, "scan_run_123", True, True)
+            result = _process_file_work(_SAMPLE_FILE_INFO, _ALBUM_ID, mock_pool, _SCAN_RUN_ID, True, True)
             
             # Verify processing was called
             mock_pool.apply_async.assert_called_once()
             mock_coord.assert_called_once()
             assert result["type"] == "media_item"
     
-    def test_process_file_work_with_sidecar(self, test_db):
+    def test_process_file_work_with_sidecar(self):
         """Test file processing with sidecar."""
-        sidecar_path = Path("/test/file.jpg.supplemental-metadata.json")
-        file_info = FileInfo(
-            file_path=Path("/test/file.jpg"),
-            relative_path=Path("test/file.jpg"),
-            album_folder_path=Path("test"),
-            json_sidecar_path=sidecar_path,
-            file_size=1024
-        )
-        
         # Mock the process pool
-        mock_pool = Mock()
-        mock_future = Mock()
-        mock_future.get.return_value = {"error": False, "metadata": {}}
-        mock_pool.apply_async.return_value = mock_future
+        mock_pool = Mock(spec=Pool)
+        mock_pool.apply_async.return_value.get.return_value = _OK_RESULT
         
         # Mock the metadata coordinator
         with patch('gphotos_321sync.media_scanner.parallel.worker_thread.coordinate_metadata') as mock_coord:
             mock_coord.return_value = ({}, [])
             
-            result = _process_file_work(file_info, "test_album", mock_pool, "scan_run_123", True, True)
+            result = _process_file_work(_SIDECAR_FILE_INFO, _ALBUM_ID, mock_pool, _SCAN_RUN_ID, True, True)
             
             # Verify processing was called
             mock_pool.apply_async.assert_called_once()
             mock_coord.assert_called_once()
             assert result["type"] == "media_item"
     
-    def test_process_file_work_exception(self, test_db):
+    def test_process_file_work_exception(self):
         """Test file processing with exception."""
-        file_info = FileInfo(
-            file_path=Path("/nonexistent/file.jpg"),
-            relative_path=Path("nonexistent/file.jpg"),
-            album_folder_path=Path("nonexistent"),
-            json_sidecar_path=None,
-            file_size=1024
-        )
-        
         # Mock the file processing to raise an exception
         with patch('gphotos_321sync.media_scanner.parallel.worker_thread._process_file_work') as mock_process:
             mock_process.side_effect = Exception("Processing failed")
             
             # Should handle exception gracefully
             try:
-                result = _process_file_work(file_info, test_db, None)
+                result = _process_file_work(_MISSING_FILE_INFO, _ALBUM_ID, None)
             except Exception:
                 # Exception should be handled by the worker thread
                 pass
 
 
+@pytest.mark.timeout(_WORKER_TIMEOUT)
 class TestWorkerThreadIntegration:
     """Integration tests for worker thread."""
     
-    def test_worker_thread_with_real_database(self, work_queue, results_queue, shutdown_event, test_db):
-        """Test worker thread with real database operations."""
-        # Create a real FileInfo
-        file_info = FileInfo(
-            file_path=Path("/test/file.jpg"),
-            relative_path=Path("test/file.jpg"),
-            album_folder_path=Path("test"),
-            json_sidecar_path=None,
-            file_size=1024
-        )
-        
-        # Add work to queue (worker expects tuple of (file_info, album_id))
-        work_queue.put((file_info, "test_album"))
-        work_queue.put(None)  # Sentinel to stop worker
-        
-        # Start worker thread
-        from unittest.mock import Mock
-        mock_pool = Mock()
-        
-        worker = threading.Thread(
-            target=worker_thread_main,
-            args=(1, work_queue, results_queue, mock_pool, str(test_db.db_path), 
-                 "test_scan_run", "2024-01-01T00:00:00+00:00", False, False, shutdown_event)
-        )
-        worker.start()
-        
-        # Wait for worker to process
-        worker.join(timeout=5)
-        
-        # Verify worker completed
-        assert not worker.is_alive()
-    
-    def test_worker_thread_concurrent_execution(self, test_db):
+    def test_worker_thread_concurrent_execution(self, worker_pool, work_queue, results_queue, shutdown_event, test_db):
         """Test multiple worker threads running concurrently."""
-        work_queue = Queue()
-        results_queue = Queue()
-        shutdown_event = threading.Event()
-        
-        # Create multiple FileInfo objects
-        file_infos = [
-            FileInfo(
-                file_path=Path(f"/test/file{i}.jpg"),
-                relative_path=Path(f"test/file{i}.jpg"),
-                album_folder_path=Path("test"),
-                json_sidecar_path=None,
-                file_size=1024
-            )
-            for i in range(5)
-        ]
-        
         # Add work to queue (worker expects tuple of (file_info, album_id))
-        for file_info in file_infos:
-            work_queue.put((file_info, "test_album"))
+        for file_info in _CONCURRENT_FILE_INFOS:
+            work_queue.put_nowait((file_info, _ALBUM_ID))
         
         # Add sentinels for each worker
         for _ in range(3):
-            work_queue.put(None)
+            work_queue.put_nowait(_SENTINEL)
         
         # Start multiple worker threads
-        workers = []
-        from unittest.mock import Mock
-        mock_pool = Mock()
-        
-        for i in range(3):
-            worker = threading.Thread(
-                target=worker_thread_main,
-                args=(i, work_queue, results_queue, mock_pool, str(test_db.db_path), 
-                     "test_scan_run", "2024-01-01T00:00:00+00:00", False, False, shutdown_event)
-            )
-            worker.start()
-            workers.append(worker)
+        futures = [
+            _submit_worker(worker_pool, work_queue, results_queue, shutdown_event, test_db, worker_id=i)
+            for i in range(3)
+        ]
         
         # Wait for all workers to complete
-        for worker in workers:
-            worker.join(timeout=5)
-            assert not worker.is_alive()
-    
-    def test_worker_thread_resource_cleanup(self, work_queue, results_queue, shutdown_event, test_db):
-        """Test worker thread resource cleanup."""
-        # Start worker thread
-        from unittest.mock import Mock
-        mock_pool = Mock()
-        
-        worker = threading.Thread(
-            target=worker_thread_main,
-            args=(1, work_queue, results_queue, mock_pool, str(test_db.db_path), 
-                 "test_scan_run", "2024-01-01T00:00:00+00:00", False, False, shutdown_event)
-        )
-        worker.start()
-        
-        # Set shutdown event
-        shutdown_event.set()
-        
-        # Wait for worker to shutdown
-        worker.join(timeout=5)
-        
-        # Verify worker completed and resources were cleaned up
-        assert not worker.is_alive()
-        assert shutdown_event.is_set()
+        for future in futures:
+            future.result()
@@ -35,21 +35,17 @@ class TestExtractionConfig:
         assert config.verify_checksums is False
         assert config.max_retry_attempts == 5
     
-    def test_extraction_config_validation(self):
-        """Test configuration validation."""
-        # Test invalid retry attempts
+    @pytest.mark.parametrize("attempts", [-1, 0])
+    def test_extraction_config_rejects_invalid_retry_attempts(self, attempts):
+        """Test that non-positive retry attempts are rejected."""
         with pytest.raises(ValueError):
-            ExtractionConfig(max_retry_attempts=-1)
-        
-        with pytest.raises(ValueError):
-            ExtractionConfig(max_retry_attempts=0)
-        
-        # Test valid retry attempts
-        config = ExtractionConfig(max_retry_attempts=1)
-        assert config.max_retry_attempts == 1
-        
-        config = ExtractionConfig(max_retry_attempts=100)
-        assert config.max_retry_attempts == 100
+            ExtractionConfig(max_retry_attempts=attempts)
+    
+    @pytest.mark.parametrize("attempts", [1, 100])
+    def test_extraction_config_accepts_valid_retry_attempts(self, attempts):
+        """Test that positive retry attempts are accepted."""
+        config = ExtractionConfig(max_retry_attempts=attempts)
+        assert config.max_retry_attempts == attempts
 
 
 class TestTakeoutExtractorConfig:
@@ -111,21 +107,18 @@ class TestTakeoutExtractorConfig:
         assert hasattr(config.logging, 'level')
         assert hasattr(config.logging, 'format')
     
+    @pytest.mark.parametrize("build", [
+        pytest.param(lambda: TakeoutExtractorConfig(logging=LoggingConfig(level="INVALID")), id="log_level"),
+        pytest.param(lambda: TakeoutExtractorConfig(logging=LoggingConfig(format="INVALID")), id="log_format"),
+        pytest.param(lambda: TakeoutExtractorConfig(extraction=ExtractionConfig(max_retry_attempts=-1)), id="retry_attempts"),
+    ])
+    def test_takeout_extractor_config_rejects_invalid(self, build):
+        """Test that invalid nested settings are rejected."""
+        with pytest.raises(ValueError):
+            build()
+    
     def test_takeout_extractor_config_validation(self):
         """Test complete configuration validation."""
-        # Test invalid log level
-        with pytest.raises(ValueError):
-            TakeoutExtractorConfig(logging=LoggingConfig(level="INVALID"))
-        
-        # Test invalid log format
-        with pytest.raises(ValueError):
-            TakeoutExtractorConfig(logging=LoggingConfig(format="INVALID"))
-        
-        # Test invalid retry attempts
-        with pytest.raises(ValueError):
-            TakeoutExtractorConfig(extraction=ExtractionConfig(max_retry_attempts=-1))
-        
-        # Test valid configuration
         config = TakeoutExtractorConfig(
             logging=LoggingConfig(level="WARNING", format="json"),
             extraction=ExtractionConfig(max_retry_attempts=5)